@@ -0,0 +1,344 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+from functools import reduce
+from importlib.util import find_spec
+from os.path import join
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.answers import check_answer
+from common.registry import PARTS, get_input_file_path
+
+"""
+Answer checks of the alternative engines which the puzzles themselves do not
+run (indexed, streaming, parallel, columnar and incremental modes). Every
+engine solves the bundled input of its day and its answers are checked
+against the answers stated in the puzzle docstrings, just like the puzzles,
+so a broken engine cannot go unnoticed. After the checked run, which also
+imports the engine, the engine is timed over REPEAT more runs, so that its
+correctness and speed are reported together. Engines needing NumPy are
+skipped without it.
+
+Usage: python -m benchmark.backends [--day 2]
+"""
+
+################################################################################
+
+WORKERS = 2
+REPEAT = 3
+DAY_01_TARGET = 2020
+
+KEY_NAME = "name"
+KEY_DAY = "day"
+KEY_ANSWERS = "answers"
+KEY_CORRECT = "correct"
+KEY_ERROR = "error"
+KEY_SKIPPED = "skipped"
+KEY_SECONDS = "seconds"
+
+################################################################################
+
+def _day_01_k_sum(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the pure Python k-sum engine
+    """
+
+    from day_01.k_sum import find_k_sum
+
+    entries = _read_day_01_entries(file_path)
+    return _get_product(find_k_sum(entries, DAY_01_TARGET, 2)), \
+        _get_product(find_k_sum(entries, DAY_01_TARGET, 3, use_numpy=False))
+
+################################################################################
+
+def _day_01_k_sum_numpy(file_path: str) -> Tuple[Optional[int], int]:
+    """
+    :param file_path: puzzle input file path
+    :return: part 2 answer of the NumPy k-sum engine (triples only)
+    """
+
+    from day_01.k_sum import find_k_sum
+
+    entries = _read_day_01_entries(file_path)
+    return None, _get_product(
+        find_k_sum(entries, DAY_01_TARGET, 3, use_numpy=True))
+
+################################################################################
+
+def _day_01_index(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the expense report index
+    """
+
+    from day_01.expense_report_index import ExpenseReportIndex
+
+    index = ExpenseReportIndex(_read_day_01_entries(file_path))
+    return _get_product(index.find(DAY_01_TARGET, 2)), \
+        _get_product(index.find(DAY_01_TARGET, 3))
+
+################################################################################
+
+def _day_01_stream(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the streaming mode
+    """
+
+    from day_01.stream import get_product_streaming, read_entries
+
+    with open(file_path, 'r') as f:
+        pair_product = get_product_streaming(read_entries(f), 2)
+    with open(file_path, 'r') as f:
+        triple_product = get_product_streaming(read_entries(f), 3)
+    return pair_product, triple_product
+
+################################################################################
+
+def _day_02_parallel(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the parallel mode
+    """
+
+    from day_02.parallel import count_valid_parallel
+
+    return count_valid_parallel(file_path, WORKERS)
+
+################################################################################
+
+def _day_02_columnar(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the columnar NumPy engine
+    """
+
+    from day_02.columnar import count_valid_columnar
+
+    return count_valid_columnar(file_path)
+
+################################################################################
+
+def _day_02_incremental(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the incremental mode, updated twice
+    """
+
+    from day_02.incremental import IncrementalValidator
+
+    with TemporaryDirectory() as directory:
+        validator = IncrementalValidator(
+            file_path, join(directory, "checkpoint.json"))
+        validator.update()
+        # the second update starts from the checkpoint
+        return validator.update()
+
+################################################################################
+
+def _day_03_tree_array(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the NumPy engine
+    """
+
+    from day_03.tree_array import TreeArray
+
+    counts = TreeArray(file_path).count_trees(_get_day_03_slopes())
+    return int(counts[1]), _get_product(int(count) for count in counts)
+
+################################################################################
+
+def _day_03_streaming(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the streaming mode reading the file
+    """
+
+    from day_03.streaming import count_trees_in_file
+
+    counts = count_trees_in_file(file_path, _get_day_03_slopes())
+    return counts[1], _get_product(counts)
+
+################################################################################
+
+def _day_03_streaming_rows(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the streaming mode reading the lines of the file
+    """
+
+    from day_03.streaming import count_trees_streaming
+
+    with open(file_path, 'rb') as f:
+        counts = count_trees_streaming(f, _get_day_03_slopes())
+    return counts[1], _get_product(counts)
+
+################################################################################
+
+def _day_04_parallel(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: puzzle input file path
+    :return: answers of the parallel mode
+    """
+
+    from day_04.parallel import validate_parallel
+
+    present_count, valid_count, _ = validate_parallel(file_path, WORKERS)
+    return present_count, valid_count
+
+################################################################################
+
+# name: (day, engine solving both parts, None for a part it does not solve,
+# True if it needs NumPy)
+BACKENDS: Dict[str, Tuple[int, Callable[[str], Tuple[Optional[int], ...]],
+                          bool]] = {
+    "day_01.k_sum": (1, _day_01_k_sum, False),
+    "day_01.k_sum (NumPy)": (1, _day_01_k_sum_numpy, True),
+    "day_01.expense_report_index": (1, _day_01_index, False),
+    "day_01.stream": (1, _day_01_stream, False),
+    "day_02.parallel": (2, _day_02_parallel, False),
+    "day_02.columnar": (2, _day_02_columnar, True),
+    "day_02.incremental": (2, _day_02_incremental, False),
+    "day_03.tree_array": (3, _day_03_tree_array, True),
+    "day_03.streaming (file)": (3, _day_03_streaming, False),
+    "day_03.streaming (rows)": (3, _day_03_streaming_rows, False),
+    "day_04.parallel": (4, _day_04_parallel, False)
+}
+
+################################################################################
+
+def check_backends(days: Optional[Tuple[int, ...]] = None,
+                   repeat: int = REPEAT) -> List[Dict[str, object]]:
+    """
+    :param days: days whose engines are checked, all if None
+    :param repeat: how many times each engine is timed after the checked run
+    :return: checks with the engine name, the day, the answers (None for the
+    parts not solved), if they are all correct (None if skipped or failed),
+    the error message (None if there was none), if the engine was skipped
+    and the median running time in seconds (None if not timed)
+    """
+
+    numpy_available = find_spec("numpy") is not None
+    checks = []
+
+    for name, (day, engine, needs_numpy) in BACKENDS.items():
+        if days is not None and day not in days:
+            continue
+        check = {KEY_NAME: name, KEY_DAY: day, KEY_ANSWERS: None,
+                 KEY_CORRECT: None, KEY_ERROR: None,
+                 KEY_SKIPPED: needs_numpy and not numpy_available,
+                 KEY_SECONDS: None}
+        checks.append(check)
+        if check[KEY_SKIPPED]:
+            continue
+
+        file_path = get_input_file_path(day)
+        try:
+            check[KEY_ANSWERS] = engine(file_path)
+            times = []
+            for _ in range(repeat):
+                start = perf_counter()
+                engine(file_path)
+                times.append(perf_counter() - start)
+            check[KEY_SECONDS] = median(times) if times else None
+        except Exception as e:
+            check[KEY_ERROR] = "{}: {}".format(type(e).__name__, e)
+            continue
+        check[KEY_CORRECT] = all(
+            check_answer(day, part, answer) is not False
+            for part, answer in zip(PARTS, check[KEY_ANSWERS])
+            if answer is not None)
+
+    return checks
+
+################################################################################
+
+def format_checks(checks: List[Dict[str, object]]) -> str:
+    """
+    :param checks: engine checks
+    :return: human readable table of the checks
+    """
+
+    lines = ["{:>3} {:<30} {:>12} {}".format(
+        "day", "engine", "median [s]", "answers")]
+    for check in checks:
+        if check[KEY_SKIPPED]:
+            status = "skipped, NumPy not installed"
+        elif check[KEY_ERROR] is not None:
+            status = check[KEY_ERROR]
+        else:
+            status = "{} {}".format(
+                "ok" if check[KEY_CORRECT] else "WRONG",
+                ', '.join('-' if answer is None else str(answer)
+                          for answer in check[KEY_ANSWERS]))
+        lines.append("{:>3} {:<30} {:>12} {}".format(
+            check[KEY_DAY], check[KEY_NAME],
+            '' if check[KEY_SECONDS] is None
+            else "{:.6f}".format(check[KEY_SECONDS]),
+            status))
+    return '\n'.join(lines)
+
+################################################################################
+
+def is_failed(check: Dict[str, object]) -> bool:
+    """
+    :param check: engine check
+    :return: True if the engine gave a wrong answer or failed, False if it
+    was correct or skipped
+    """
+
+    return check[KEY_CORRECT] is False or check[KEY_ERROR] is not None
+
+################################################################################
+
+def _get_day_03_slopes() -> List[Tuple[int, int]]:
+    """
+    :return: (right, down) slopes of day 3, the part 1 slope second
+    """
+
+    from day_03.day_03 import KEY_DOWN, KEY_RIGHT, SLOPES
+
+    return [(slope[KEY_RIGHT], slope[KEY_DOWN]) for slope in SLOPES]
+
+################################################################################
+
+def _read_day_01_entries(file_path: str) -> List[int]:
+    """
+    :param file_path: puzzle input file path
+    :return: expense report entries
+    """
+
+    with open(file_path, 'r') as f:
+        return [int(line) for line in f if line.strip()]
+
+################################################################################
+
+def _get_product(values: Iterable[int]) -> int:
+    """
+    :param values: values
+    :return: product of the values
+    """
+
+    return reduce(lambda x, y: x * y, values)
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Answer checks of the engines the puzzles do not run.")
+    parser.add_argument(
+        "--day", type=int, action="append",
+        help="day whose engines are checked, can be repeated; all if omitted")
+    arguments = parser.parse_args()
+
+    checks = check_backends(tuple(arguments.day) if arguments.day else None)
+    print(format_checks(checks))
+    exit(1 if any(is_failed(check) for check in checks) else 0)
+
+################################################################################
@@ -0,0 +1,367 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass, field
+from math import ceil, log
+from multiprocessing import TimeoutError, get_context
+from os.path import join
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from benchmark.backends import check_backends, format_checks, is_failed
+from common.answers import check_answer
+from common.input_loader import clear_cache
+from common.registry import \
+    DAYS, PARTS, get_generator_module, get_input_file_path, get_puzzle
+
+"""
+Benchmark of all the puzzles. Every puzzle is timed on its bundled input and
+on bigger generated inputs; the fitted growth exponent tells how the running
+time grows with the input size (1.0 linear, 2.0 quadratic etc.). A run
+exceeding the timeout is stopped and its time recorded as a lower bound, and
+slow puzzles are run fewer times, so that one input size takes about
+TIME_BUDGET seconds. Every run on the bundled input is also checked against
+the answer stated in the puzzle docstring, so a faster but wrong solution
+cannot go unnoticed, and so are the answers of the engines the puzzles do not
+run (see backends); the benchmark exits with 1 if any answer is wrong.
+
+Usage: python -m benchmark.benchmark [--day 7] [--scales 1 2 4 10 100]
+"""
+
+################################################################################
+
+SCALES = (1, 2, 4, 10, 100)
+REPEAT = 5
+# seconds allowed for a single run
+TIMEOUT = 60.0
+# seconds the repeated runs of one input size should take; no more runs are
+# started once the next one would not fit, but there is always at least one
+TIME_BUDGET = 60.0
+
+SEED = 0
+# the running time of day 15 does not depend on its input size
+UNSCALABLE_DAYS = (15,)
+
+################################################################################
+
+@dataclass
+class Measurement(object):
+    scale: int
+    times: List[float] = field(default_factory=list)
+    answers: List[int] = field(default_factory=list)
+    # None if the expected answer is not known (generated inputs)
+    correct: Optional[bool] = None
+    error: Optional[str] = None
+    # the last run was stopped after the timeout; its time is a lower bound
+    timed_out: bool = False
+
+    @property
+    def median(self) -> float:
+        """
+        :return: median running time in seconds
+        """
+
+        return median(self.times)
+
+    @property
+    def p95(self) -> float:
+        """
+        :return: 95th percentile of the running time in seconds
+        """
+
+        return _percentile(self.times, 95)
+
+################################################################################
+
+@dataclass
+class Result(object):
+    day: int
+    part: int
+    measurements: List[Measurement] = field(default_factory=list)
+
+    @property
+    def growth_exponent(self) -> Optional[float]:
+        """
+        Least squares fit of log(time) = a + b * log(scale).
+
+        :return: the growth exponent b, None if there are less than two
+        completed measurements
+        """
+
+        points = [(log(measurement.scale), log(measurement.median))
+                  for measurement in self.measurements
+                  if measurement.error is None and not measurement.timed_out
+                  and measurement.median > 0]
+        if len(points) < 2:
+            return None
+
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) \
+            / sum((x - mean_x) ** 2 for x, _ in points)
+
+################################################################################
+
+    @property
+    def growth_exponent_lower_bound(self) -> Optional[float]:
+        """
+        The run of a size which timed out took at least the timeout, so the
+        growth from the last completed size is at least as steep as if it
+        took exactly the timeout.
+
+        :return: lower bound of the growth exponent, None if no size timed
+        out after a completed one
+        """
+
+        completed = [measurement for measurement in self.measurements
+                     if measurement.error is None
+                     and not measurement.timed_out and measurement.median > 0]
+        timed_out = [measurement for measurement in self.measurements
+                     if measurement.timed_out]
+        if not completed or not timed_out:
+            return None
+
+        last, stopped = completed[-1], timed_out[0]
+        return log(stopped.times[-1] / last.median) \
+            / log(stopped.scale / last.scale)
+
+################################################################################
+
+def benchmark(days: Tuple[int, ...] = tuple(DAYS),
+              scales: Tuple[int, ...] = SCALES,
+              repeat: int = REPEAT,
+              timeout: float = TIMEOUT,
+              time_budget: float = TIME_BUDGET) -> List[Result]:
+    """
+    Times every puzzle of the specified days on inputs of the specified
+    scales. Each input size is measured in a fresh process; once a size times
+    out or fails, the bigger ones are skipped.
+
+    :param days: days to benchmark
+    :param scales: input sizes, as multiples of the bundled input size
+    :param repeat: how many times each puzzle is run per input size at most
+    :param timeout: seconds allowed for a single run
+    :param time_budget: seconds the runs of one input size should take
+    :return: benchmark results
+    """
+
+    results = []
+
+    with TemporaryDirectory() as directory:
+        for day in days:
+            day_scales = (1,) if day in UNSCALABLE_DAYS else scales
+            file_paths = {scale: _scale_input(day, scale, directory)
+                          for scale in day_scales}
+
+            for part in PARTS:
+                result = Result(day, part)
+                results.append(result)
+
+                for scale in day_scales:
+                    measurement = _measure_in_process(
+                        day, part, file_paths[scale], scale, repeat, timeout,
+                        time_budget)
+                    result.measurements.append(measurement)
+                    if measurement.error is not None or measurement.timed_out:
+                        break
+
+    return results
+
+################################################################################
+
+def format_results(results: List[Result]) -> str:
+    """
+    :param results: benchmark results
+    :return: human readable table of the results
+    """
+
+    lines = ["{:>3} {:>4} {:>5} {:>12} {:>12} {:>8} {}".format(
+        "day", "part", "scale", "median [s]", "p95 [s]", "exponent", "answer")]
+
+    for result in results:
+        exponent = result.growth_exponent
+        for measurement in result.measurements:
+            if measurement.timed_out:
+                lower_bound = result.growth_exponent_lower_bound
+                lines.append("{:>3} {:>4} {:>5} {:>12} {:>12} {:>8} {}".format(
+                    result.day, result.part, measurement.scale,
+                    ">{:.6f}".format(measurement.times[-1]), '',
+                    '' if lower_bound is None
+                    else ">{:.2f}".format(lower_bound),
+                    "timeout"))
+            elif measurement.error is None:
+                lines.append(
+                    "{:>3} {:>4} {:>5} {:>12.6f} {:>12.6f} {:>8} {}".format(
+                        result.day, result.part, measurement.scale,
+                        measurement.median, measurement.p95,
+                        '' if exponent is None else "{:.2f}".format(exponent),
+                        _format_correctness(measurement)))
+            else:
+                lines.append("{:>3} {:>4} {:>5} {}".format(
+                    result.day, result.part, measurement.scale,
+                    measurement.error))
+
+    return '\n'.join(lines)
+
+################################################################################
+
+def _scale_input(day: int, scale: int, directory: str) -> str:
+    """
+    :param day: day number
+    :param scale: input size, as a multiple of the bundled input size
+    :param directory: directory to write the generated input to
+    :return: file path of the bundled input for scale 1, of a generated input
+    otherwise
+    """
+
+    if scale == 1:
+        return get_input_file_path(day)
+
+    generator = get_generator_module(day)
+    file_path = join(directory, "day_{:02}_x{}.txt".format(day, scale))
+    generator.generate(file_path, scale * generator.BUNDLED_SIZE, SEED)
+    return file_path
+
+################################################################################
+
+def _measure_in_process(day: int, part: int, file_path: str, scale: int,
+                        repeat: int, timeout: float,
+                        time_budget: float) -> Measurement:
+    """
+    Runs the measurement in a separate process so that a run can be stopped
+    once it exceeds the timeout. The puzzle is run up to the repeat count, as
+    long as the next run fits into the time budget judging by the last one.
+
+    :param day: day number
+    :param part: puzzle part
+    :param file_path: puzzle input file path
+    :param scale: input scale, only recorded in the measurement
+    :param repeat: how many times the puzzle is run at most
+    :param timeout: seconds allowed for a single run
+    :param time_budget: seconds the runs should take
+    :return: measurement
+    """
+
+    measurement = Measurement(scale)
+
+    with get_context("spawn").Pool(1) as pool:
+        try:
+            while len(measurement.times) < repeat and (
+                    not measurement.times
+                    or sum(measurement.times) + measurement.times[-1]
+                    <= time_budget):
+                seconds, answer = pool.apply_async(
+                    _measure, (day, part, file_path)).get(timeout)
+                measurement.times.append(seconds)
+                measurement.answers.append(answer)
+        except TimeoutError:
+            # the pool is terminated on leaving, which stops the run
+            measurement.times = [timeout]
+            measurement.answers = []
+            measurement.timed_out = True
+        except Exception as e:
+            measurement.error = "{}: {}".format(type(e).__name__, e)
+
+    if measurement.error is None and not measurement.timed_out \
+            and scale == 1:
+        checks = [check_answer(day, part, answer)
+                  for answer in measurement.answers]
+        measurement.correct = None if None in checks else all(checks)
+
+    return measurement
+
+################################################################################
+
+def _measure(day: int, part: int, file_path: str) -> Tuple[float, int]:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :param file_path: puzzle input file path
+    :return: running time in seconds and answer of one run
+    """
+
+    puzzle = get_puzzle(day, part)
+    # every run parses its input, as a single run would
+    clear_cache()
+    start = perf_counter()
+    answer = puzzle(file_path)
+    return perf_counter() - start, answer
+
+################################################################################
+
+def _format_correctness(measurement: Measurement) -> str:
+    """
+    :param measurement: measurement
+    :return: "ok" if all the answers are correct, "WRONG" and the answers if
+    not, the answers if their correctness is not known
+    """
+
+    answers = ', '.join(str(answer) for answer in sorted(set(
+        measurement.answers)))
+    if measurement.correct is None:
+        return answers
+    return "ok" if measurement.correct else "WRONG: {}".format(answers)
+
+################################################################################
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """
+    Nearest rank percentile.
+
+    :param values: values
+    :param percentile: percentile, 0 to 100
+    :return: the value at the percentile
+    """
+
+    ordered = sorted(values)
+    return ordered[max(ceil(percentile / 100 * len(ordered)) - 1, 0)]
+
+################################################################################
+
+def _parse_arguments() -> Namespace:
+    """
+    :return: parsed command line arguments
+    """
+
+    parser = ArgumentParser(description="Benchmark of the puzzles.")
+    parser.add_argument(
+        "--day", type=int, action="append", choices=sorted(DAYS),
+        help="day to benchmark, can be repeated; all days if omitted")
+    parser.add_argument(
+        "--scales", type=int, nargs='+', default=SCALES,
+        help="input scales")
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT,
+        help="maximum runs per input size")
+    parser.add_argument(
+        "--timeout", type=float, default=TIMEOUT,
+        help="seconds allowed per run; a longer run is stopped and its time "
+             "recorded as a lower bound")
+    parser.add_argument(
+        "--budget", dest="time_budget", type=float, default=TIME_BUDGET,
+        help="seconds the runs of one input size should take; slow puzzles "
+             "are run fewer times")
+    return parser.parse_args()
+
+################################################################################
+
+if __name__ == "__main__":
+    arguments = _parse_arguments()
+    results = benchmark(
+        tuple(arguments.day) if arguments.day else tuple(DAYS),
+        tuple(arguments.scales), arguments.repeat, arguments.timeout,
+        arguments.time_budget)
+    checks = check_backends(
+        tuple(arguments.day) if arguments.day else None)
+    print(format_results(results))
+    print()
+    print(format_checks(checks))
+    exit(1 if any(measurement.correct is False
+                  for result in results
+                  for measurement in result.measurements)
+         or any(is_failed(check) for check in checks) else 0)
+
+################################################################################
@@ -0,0 +1,57 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from ast import FunctionDef, get_docstring
+from re import compile
+from typing import Optional
+
+from common.registry import PARTS, PUZZLE_NAME, parse_module
+
+"""
+Expected answers of the puzzles on their bundled inputs, read from the puzzle
+docstrings ("The answer should be 444019."). They let the runner and the
+benchmark check that a faster solution still gives the same answers. The
+docstrings are read from the parsed source of the day module, which is not
+imported, so checking a cached answer does not pay for the imports of the day.
+"""
+
+################################################################################
+
+ANSWER_PATTERN = compile(r"The answer should be\s+(\d+)\.")
+
+################################################################################
+
+def get_expected_answer(day: int, part: int) -> Optional[int]:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :return: the answer stated in the puzzle docstring, None if the docstring
+    does not state one
+    """
+
+    if part not in PARTS:
+        raise ValueError("Part {} does not exist (parts: 1, 2).".format(part))
+
+    name = PUZZLE_NAME.format(part)
+    for node in parse_module(day).body:
+        if isinstance(node, FunctionDef) and node.name == name:
+            match = ANSWER_PATTERN.search(get_docstring(node) or '')
+            return None if match is None else int(match.group(1))
+
+    return None
+
+################################################################################
+
+def check_answer(day: int, part: int, answer: int) -> Optional[bool]:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :param answer: answer to the puzzle on its bundled input
+    :return: True if the answer is the expected one, False if it is not, None
+    if the expected answer is not known
+    """
+
+    expected = get_expected_answer(day, part)
+    return None if expected is None else answer == expected
+
+################################################################################
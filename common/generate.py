@@ -0,0 +1,36 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+
+from common.registry import DAYS, get_generator_module
+
+"""
+Writes a generated puzzle input.
+
+Usage: python -m common.generate --day 2 --size 1000000 [--seed 0] FILE_PATH
+"""
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Puzzle input generator.")
+    parser.add_argument(
+        "--day", type=int, required=True, choices=sorted(DAYS),
+        help="day to generate the input for")
+    parser.add_argument(
+        "--size", type=int, required=True,
+        help="input size (lines, records, rules etc. depending on the day)")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="random seed")
+    parser.add_argument(
+        "file_path",
+        help="file path to write the input to")
+    arguments = parser.parse_args()
+
+    get_generator_module(arguments.day).generate(
+        arguments.file_path, arguments.size, arguments.seed)
+    exit(0)
+
+################################################################################
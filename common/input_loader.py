@@ -0,0 +1,63 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from collections import OrderedDict
+from os import stat
+from os.path import abspath
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+from common.instrumentation import phase
+
+"""
+Shared puzzle input loader. Each input file is parsed once per process and the
+parsed structure is handed to both puzzles of the day, so solving both parts
+costs one parse. The parsed structures are shared; puzzles must not modify
+them (copy what needs to change). Actual parsing is recorded as the
+"<day package>.parse" instrumentation phase.
+"""
+
+################################################################################
+
+T = TypeVar('T')
+
+CACHE_SIZE = 32
+
+_cache: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+
+################################################################################
+
+def load_input(file_path: str, parse: Callable[[str], T]) -> T:
+    """
+    Returns the parsed input, parsing the file only if it was not parsed
+    before by the same function (or the file changed since).
+
+    :param file_path: puzzle input file path
+    :param parse: function parsing the input file
+    :return: parsed input
+    """
+
+    status = stat(file_path)
+    key = (abspath(file_path), status.st_mtime_ns, status.st_size,
+           parse.__module__, parse.__qualname__)
+
+    try:
+        _cache.move_to_end(key)
+        return _cache[key]
+    except KeyError:
+        with phase("{}.parse".format(parse.__module__.split('.')[0])):
+            parsed = parse(file_path)
+        _cache[key] = parsed
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return parsed
+
+################################################################################
+
+def clear_cache() -> None:
+    """
+    Forgets all the parsed inputs.
+    """
+
+    _cache.clear()
+
+################################################################################
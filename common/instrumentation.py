@@ -0,0 +1,161 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from contextlib import nullcontext
+from functools import wraps
+from json import dump
+from time import perf_counter, process_time
+from typing import Any, Callable, ContextManager, Dict, Optional
+
+"""
+Lightweight phase timing. Named phases record their call count, wall time and
+CPU time, either as a context manager:
+
+    with phase("day_07.parse"):
+        ...
+
+or as a function decorator (@timed()). Recursive and nested entries of the
+same phase are counted as calls, but their time is taken only once, by the
+outermost entry. Instrumentation is disabled by default; then phase() returns
+a shared do-nothing context and decorated functions are called directly.
+Even then a decorated call goes through the wrapper, so only the parse and
+solve boundaries are decorated, never helpers called per record or per step.
+"""
+
+################################################################################
+
+KEY_CALLS = "calls"
+KEY_WALL_SECONDS = "wall_seconds"
+KEY_CPU_SECONDS = "cpu_seconds"
+
+_NULL_CONTEXT = nullcontext()
+
+_enabled = False
+_statistics: Dict[str, Dict[str, float]] = {}
+_depths: Dict[str, int] = {}
+
+################################################################################
+
+class _Phase(object):
+    __slots__ = ("_name", "_wall_start", "_cpu_start")
+
+################################################################################
+
+    def __init__(self, name: str):
+        self._name = name
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+################################################################################
+
+    def __enter__(self) -> "_Phase":
+        depth = _depths.get(self._name, 0)
+        _depths[self._name] = depth + 1
+        if depth == 0:
+            self._wall_start = perf_counter()
+            self._cpu_start = process_time()
+        return self
+
+################################################################################
+
+    def __exit__(self, *exception_info) -> None:
+        statistics = _statistics.setdefault(self._name, {
+            KEY_CALLS: 0,
+            KEY_WALL_SECONDS: 0.0,
+            KEY_CPU_SECONDS: 0.0
+        })
+        statistics[KEY_CALLS] += 1
+        _depths[self._name] -= 1
+        if _depths[self._name] == 0:
+            statistics[KEY_WALL_SECONDS] += perf_counter() - self._wall_start
+            statistics[KEY_CPU_SECONDS] += process_time() - self._cpu_start
+
+################################################################################
+
+def enable() -> None:
+    """
+    Starts recording the phases.
+    """
+
+    global _enabled
+    _enabled = True
+
+################################################################################
+
+def disable() -> None:
+    """
+    Stops recording the phases; the recorded statistics are kept.
+    """
+
+    global _enabled
+    _enabled = False
+
+################################################################################
+
+def reset() -> None:
+    """
+    Forgets the recorded statistics.
+    """
+
+    _statistics.clear()
+    _depths.clear()
+
+################################################################################
+
+def phase(name: str) -> ContextManager:
+    """
+    :param name: phase name, "<day package>.<phase>" by convention
+    :return: context manager recording the phase if instrumentation is
+    enabled, a do-nothing one otherwise
+    """
+
+    return _Phase(name) if _enabled else _NULL_CONTEXT
+
+################################################################################
+
+def timed(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call of the function as a phase.
+
+    :param name: phase name, "<day package>.<function name>" if None
+    :return: decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+        phase_name = name if name is not None else "{}.{}".format(
+            function.__module__.split('.')[0], function.__qualname__)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Phase(phase_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+################################################################################
+
+def get_statistics() -> Dict[str, Dict[str, float]]:
+    """
+    :return: copy of the recorded statistics; phase name -> calls, wall time
+    and CPU time in seconds
+    """
+
+    return {name: dict(statistics)
+            for name, statistics in _statistics.items()}
+
+################################################################################
+
+def export_json(file_path: str, data: Any = None) -> None:
+    """
+    :param file_path: file path to write the JSON to
+    :param data: data to write, the recorded statistics if None
+    """
+
+    with open(file_path, 'w') as f:
+        dump(get_statistics() if data is None else data, f, indent=4)
+
+################################################################################
@@ -0,0 +1,145 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from os import sysconf
+from resource import RUSAGE_SELF, getrusage
+import threading
+from threading import Event, Thread
+from time import perf_counter
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+"""
+Memory profiler for the puzzles. While a function runs, tracemalloc traces the
+Python allocations and a sampling thread reads the resident set size of the
+process. The thread also takes a tracemalloc snapshot whenever the traced
+memory grows past the previous snapshot by SNAPSHOT_GROWTH, so the top
+allocation sites are reported as they were close to the peak, not after the
+function released its memory. Snapshots copy every traced block, so none are
+taken past SNAPSHOT_LIMIT (day 15 part 2 would run out of memory); the sites
+are then reported from the last snapshot before the limit. Tracing slows the
+function down considerably and tracemalloc needs tens of bytes per live block
+(day 15 part 2 does not fit in 6 GiB when traced), so it can be turned off to
+only sample the RSS. The timings of profiled runs mean nothing.
+"""
+
+################################################################################
+
+SAMPLING_INTERVAL = 0.05
+SNAPSHOT_GROWTH = 1.5
+SNAPSHOT_LIMIT = 256 * 1024 * 1024
+TOP_SITES_COUNT = 10
+
+KEY_PEAK_TRACED_BYTES = "peak_traced_bytes"
+KEY_PEAK_RSS_BYTES = "peak_rss_bytes"
+KEY_TOP_SITES = "top_sites"
+KEY_RSS_SAMPLES = "rss_samples"
+KEY_SITE = "site"
+KEY_BYTES = "bytes"
+KEY_COUNT = "count"
+
+_STATM_FILE_PATH = "/proc/self/statm"
+
+################################################################################
+
+def profile_memory(function: Callable[..., Any], *args,
+                   trace: bool = True,
+                   interval: float = SAMPLING_INTERVAL,
+                   top_sites_count: int = TOP_SITES_COUNT) \
+        -> Tuple[Any, Dict[str, Any]]:
+    """
+    :param function: function to profile
+    :param args: function arguments
+    :param trace: True to trace the allocations, False to only sample the RSS
+    :param interval: RSS sampling interval in seconds
+    :param top_sites_count: number of the top allocation sites to report
+    :return: function return value and memory report with the peak traced
+    memory (None if not traced), the peak RSS, the top allocation sites
+    (file:line, bytes and allocations count; empty if not traced) and the RSS
+    samples ([seconds, bytes] pairs)
+    """
+
+    samples: List[List[float]] = []
+    # traced memory at the snapshot and the snapshot itself
+    snapshot: List[Any] = [0, None]
+    stop = Event()
+    start = perf_counter()
+
+    def update_snapshot(growth: float) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current <= SNAPSHOT_LIMIT \
+                and (snapshot[1] is None or current > snapshot[0] * growth):
+            snapshot[:] = [current, tracemalloc.take_snapshot()]
+
+    def sample() -> None:
+        while True:
+            samples.append([perf_counter() - start, _get_rss()])
+            if trace:
+                update_snapshot(SNAPSHOT_GROWTH)
+            if stop.wait(interval):
+                break
+
+    was_tracing = tracemalloc.is_tracing()
+    if trace:
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    sampler = Thread(target=sample, daemon=True)
+    sampler.start()
+
+    try:
+        value = function(*args)
+    finally:
+        stop.set()
+        sampler.join()
+        if trace:
+            update_snapshot(1)
+            _, peak = tracemalloc.get_traced_memory()
+            if not was_tracing:
+                tracemalloc.stop()
+
+    samples.append([perf_counter() - start, _get_rss()])
+    report = {
+        KEY_PEAK_TRACED_BYTES: peak if trace else None,
+        KEY_PEAK_RSS_BYTES: max(rss for _, rss in samples),
+        KEY_TOP_SITES: [] if not trace else [{
+            KEY_SITE: "{}:{}".format(statistic.traceback[0].filename,
+                                     statistic.traceback[0].lineno),
+            KEY_BYTES: statistic.size,
+            KEY_COUNT: statistic.count
+        } for statistic in snapshot[1].filter_traces([
+            # the profiler's own allocations
+            tracemalloc.Filter(False, module_file_path)
+            for module_file_path in (
+                __file__, threading.__file__, tracemalloc.__file__)
+        ]).statistics("lineno")[:top_sites_count]],
+        KEY_RSS_SAMPLES: samples
+    }
+    return value, report
+
+################################################################################
+
+def _get_rss() -> int:
+    """
+    :return: current resident set size of the process in bytes, the peak one
+    where the current one cannot be read
+    """
+
+    try:
+        with open(_STATM_FILE_PATH, 'r') as f:
+            return int(f.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return _get_peak_rss()
+
+################################################################################
+
+def _get_peak_rss() -> int:
+    """
+    :return: peak resident set size of the process in bytes (since the process
+    started, not only during the profiled function)
+    """
+
+    # kilobytes on Linux
+    return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+
+################################################################################
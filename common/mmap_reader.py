@@ -0,0 +1,100 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from contextlib import contextmanager
+from mmap import mmap, ACCESS_READ
+from os import fstat
+from typing import Iterator, List, Optional, Tuple, Union
+
+"""
+Memory-mapped input reader. Lines are sliced straight out of the mapped file
+one at a time, so neither the file content nor a list of its lines is ever
+held in memory; only the parsed result is.
+"""
+
+################################################################################
+
+NEWLINE = b'\n'
+CARRIAGE_RETURN = b'\r'
+
+################################################################################
+
+@contextmanager
+def open_mapped(file_path: str) -> Iterator[Union[mmap, bytes]]:
+    """
+    Maps the file into memory for reading; the mapping supports the buffer
+    protocol, so it can be sliced, searched and matched by bytes regular
+    expressions without reading the file.
+
+    :param file_path: file path
+    :return: read only mapping of the file (empty bytes for an empty file,
+    which cannot be mapped)
+    """
+
+    with open(file_path, 'rb') as f:
+        if fstat(f.fileno()).st_size == 0:
+            yield b''
+        else:
+            with mmap(f.fileno(), 0, access=ACCESS_READ) as mapped:
+                yield mapped
+
+################################################################################
+
+def iter_lines(file_path: str, start: int = 0,
+               end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yields the lines of the file (or of its byte range) without the line
+    endings. The range should start at the beginning of a line; a line
+    starting before the end of the range is yielded whole.
+
+    :param file_path: file path
+    :param start: offset of the first byte to read
+    :param end: offset after the last byte to read, end of the file if None
+    :return: lines
+    """
+
+    with open_mapped(file_path) as mapped:
+        size = len(mapped)
+        end = size if end is None else min(end, size)
+        while start < end:
+            line_end = mapped.find(NEWLINE, start)
+            if line_end == -1:
+                line_end = size
+            line = mapped[start:line_end]
+            yield line[:-1] if line.endswith(CARRIAGE_RETURN) else line
+            start = line_end + 1
+
+################################################################################
+
+def split_ranges(file_path: str, count: int,
+                 separator: bytes = NEWLINE) -> List[Tuple[int, int]]:
+    """
+    Splits the file into byte ranges of about the same size, each of them
+    ending right after a separator (or at the end of the file), so that no
+    line (or record) is split between two ranges. Only the bytes around the
+    boundaries are read.
+
+    :param file_path: file path
+    :param count: number of ranges wanted; there are fewer if the file is too
+    small or the separators too sparse
+    :param separator: separator of the lines (or records)
+    :return: (start, end) offsets of the ranges, covering the whole file
+    """
+
+    with open_mapped(file_path) as mapped:
+        size = len(mapped)
+        ranges = []
+        start = 0
+        for i in range(1, count + 1):
+            if start >= size:
+                break
+            end = size * i // count
+            if end < start:
+                continue
+            boundary = mapped.find(separator, end) if i < count else -1
+            end = size if boundary == -1 else boundary + len(separator)
+            ranges.append((start, end))
+            start = end
+        return ranges
+
+################################################################################
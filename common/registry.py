@@ -0,0 +1,116 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from ast import Assign, Module, Name, literal_eval, parse
+from functools import lru_cache
+from importlib import import_module
+from os.path import abspath, dirname, join
+from types import ModuleType
+from typing import Callable, Dict, Tuple
+
+"""
+Registry of all the solved days. Day modules are imported only when a puzzle
+(or an input generator) of that day is requested, so running one day does not
+pay for the imports (pyparsing etc.) of all the others. The bundled input file
+path is read from the parsed source of the day module, without importing it.
+"""
+
+################################################################################
+
+DAYS: Dict[int, str] = {
+    1: "day_01.day_01",
+    2: "day_02.day_02",
+    3: "day_03.day_03",
+    4: "day_04.day_04",
+    5: "day_05.day_05",
+    6: "day_06.day_06",
+    7: "day_07.day_07",
+    8: "day_08.day_08",
+    9: "day_09.day_09",
+    11: "day_11.day_11",
+    12: "day_12.day_12",
+    14: "day_14.day_14",
+    15: "day_15.day_15",
+    18: "day_18.day_18"
+}
+PARTS: Tuple[int, int] = (1, 2)
+
+PUZZLE_NAME = "puzzle_{}"
+GENERATOR_MODULE_NAME = "generator"
+INPUT_FILE_PATH_NAME = "INPUT_FILE_PATH"
+ROOT_DIRECTORY = dirname(dirname(abspath(__file__)))
+
+################################################################################
+
+def get_module_name(day: int) -> str:
+    """
+    :param day: day number
+    :return: dotted name of the module with the day puzzles
+    """
+
+    try:
+        return DAYS[day]
+    except KeyError:
+        raise ValueError("Day {} is not solved (solved days: {}).".format(
+            day, ', '.join(str(day) for day in DAYS)))
+
+################################################################################
+
+def get_puzzle(day: int, part: int) -> Callable:
+    """
+    Imports the day module (if not imported yet) and returns the puzzle.
+
+    :param day: day number
+    :param part: puzzle part, 1 or 2
+    :return: puzzle function taking the input file path
+    """
+
+    if part not in PARTS:
+        raise ValueError("Part {} does not exist (parts: 1, 2).".format(part))
+    return getattr(import_module(get_module_name(day)), PUZZLE_NAME.format(part))
+
+################################################################################
+
+def get_input_file_path(day: int) -> str:
+    """
+    :param day: day number
+    :return: file path of the bundled puzzle input
+    """
+
+    for node in parse_module(day).body:
+        if isinstance(node, Assign) \
+                and any(isinstance(target, Name)
+                        and target.id == INPUT_FILE_PATH_NAME
+                        for target in node.targets):
+            return literal_eval(node.value)
+
+    # not a plain literal in the source
+    return getattr(import_module(get_module_name(day)), INPUT_FILE_PATH_NAME)
+
+################################################################################
+
+@lru_cache(maxsize=None)
+def parse_module(day: int) -> Module:
+    """
+    :param day: day number
+    :return: syntax tree of the day module source; the module is not imported
+    """
+
+    source_path = join(ROOT_DIRECTORY,
+                       get_module_name(day).replace('.', '/') + ".py")
+    with open(source_path, 'r') as f:
+        return parse(f.read(), source_path)
+
+################################################################################
+
+def get_generator_module(day: int) -> ModuleType:
+    """
+    :param day: day number
+    :return: module with the generate(file_path, size, seed) function and
+    BUNDLED_SIZE, the size of the bundled input
+    """
+
+    package = get_module_name(day).rsplit('.', 1)[0]
+    return import_module("{}.{}".format(package, GENERATOR_MODULE_NAME))
+
+################################################################################
@@ -0,0 +1,236 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from glob import glob
+from hashlib import sha256
+from json import dump, load
+from os import makedirs, remove, replace, stat, utime
+from os.path import abspath, dirname, isfile, join
+from re import MULTILINE, compile
+from typing import Any, Iterable, List, Optional
+
+from common.registry import get_module_name, GENERATOR_MODULE_NAME
+
+"""
+On-disk cache of the puzzle answers. Entries are keyed by the day, the part,
+the SHA-256 of the input file content and the solver version, which is the
+SHA-256 of the sources of the day package and of the common modules they
+import (directly or through each other); editing a solver or a shared module
+it uses therefore never returns a stale answer. The least recently used
+entries are evicted once the entries take more than the size limit.
+"""
+
+################################################################################
+
+CACHE_DIRECTORY = ".cache/results"
+SIZE_LIMIT = 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+ENTRY_SUFFIX = ".json"
+KEY_ANSWER = "answer"
+ROOT_DIRECTORY = dirname(dirname(abspath(__file__)))
+COMMON_PACKAGE_NAME = "common"
+# "from common.x import ...", "import common.x", "from common import x"
+COMMON_IMPORT_PATTERN = compile(
+    rb"^\s*(?:(?:from|import)\s+common\.(\w+)"
+    rb"|from\s+common\s+import\s+(\w+))", MULTILINE)
+
+################################################################################
+
+class ResultCache(object):
+
+    def __init__(self, directory: str = CACHE_DIRECTORY,
+                 size_limit: int = SIZE_LIMIT):
+        """
+        :param directory: directory with the cache entries
+        :param size_limit: maximum total size of the entries in bytes
+        """
+
+        self._directory = directory
+        self._size_limit = size_limit
+
+################################################################################
+
+    def get(self, day: int, part: int, file_path: str) -> Optional[Any]:
+        """
+        :param day: day number
+        :param part: puzzle part
+        :param file_path: puzzle input file path
+        :return: cached answer, None if there is no entry for the input
+        """
+
+        try:
+            return self._get(self.get_key(day, part, file_path))
+        except KeyError:
+            return None
+
+################################################################################
+
+    def put(self, day: int, part: int, file_path: str, answer: Any) -> None:
+        """
+        :param day: day number
+        :param part: puzzle part
+        :param file_path: puzzle input file path
+        :param answer: puzzle answer
+        """
+
+        self._put(self.get_key(day, part, file_path), day, part, answer)
+
+################################################################################
+
+    @staticmethod
+    def get_key(day: int, part: int, file_path: str) -> str:
+        """
+        :param day: day number
+        :param part: puzzle part
+        :param file_path: puzzle input file path
+        :return: cache key of the puzzle answer
+        """
+
+        return sha256("{}:{}:{}:{}".format(
+            day, part, _get_file_hash(file_path), _get_solver_version(day))
+                      .encode()).hexdigest()
+
+################################################################################
+
+    def _get(self, key: str) -> Any:
+        """
+        :param key: cache key
+        :return: cached answer
+        :raises KeyError: if there is no entry with the key
+        """
+
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, 'r') as f:
+                answer = load(f)[KEY_ANSWER]
+        except (OSError, ValueError, KeyError):
+            # missing or damaged entry
+            raise KeyError(key)
+
+        # the modification time orders the entries by their last use
+        utime(entry_path)
+        return answer
+
+################################################################################
+
+    def _put(self, key: str, day: int, part: int, answer: Any) -> None:
+        """
+        Writes the entry and evicts the least recently used entries over the
+        size limit.
+
+        :param key: cache key
+        :param day: day number
+        :param part: puzzle part
+        :param answer: puzzle answer
+        """
+
+        entry_path = self._get_entry_path(key)
+        makedirs(dirname(entry_path), exist_ok=True)
+        # write to a temporary file first, so that a concurrent reader never
+        # sees a partially written entry
+        temporary_path = "{}.tmp".format(entry_path)
+        with open(temporary_path, 'w') as f:
+            dump({"day": day, "part": part, KEY_ANSWER: answer}, f)
+        replace(temporary_path, entry_path)
+        self._evict()
+
+################################################################################
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the entries fit into the
+        size limit.
+        """
+
+        entries = []
+        for entry_path in glob(join(self._directory, '*' + ENTRY_SUFFIX)):
+            try:
+                status = stat(entry_path)
+            except OSError:
+                # removed by another process meanwhile
+                continue
+            entries.append((status.st_mtime, status.st_size, entry_path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_path in sorted(entries):
+            if size <= self._size_limit:
+                break
+            try:
+                remove(entry_path)
+            except OSError:
+                pass
+            size -= entry_size
+
+################################################################################
+
+    def _get_entry_path(self, key: str) -> str:
+        """
+        :param key: cache key
+        :return: file path of the cache entry
+        """
+
+        return join(self._directory, key + ENTRY_SUFFIX)
+
+################################################################################
+
+def _get_file_hash(file_path: str) -> str:
+    """
+    :param file_path: file path
+    :return: SHA-256 of the file content
+    """
+
+    file_hash = sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+################################################################################
+
+def _get_solver_version(day: int) -> str:
+    """
+    :param day: day number
+    :return: SHA-256 of the sources of the day package, input generator
+    excluded, and of the common modules they import
+    """
+
+    # the package is not imported, a cache hit should not pay for its imports
+    package_directory = join(
+        ROOT_DIRECTORY, get_module_name(day).rsplit('.', 1)[0])
+    generator_path = join(package_directory, GENERATOR_MODULE_NAME + ".py")
+    source_paths = [source_path for source_path
+                    in sorted(glob(join(package_directory, "*.py")))
+                    if source_path != generator_path]
+
+    solver_hash = sha256()
+    for source_path in source_paths + _get_common_sources(source_paths):
+        with open(source_path, 'rb') as f:
+            solver_hash.update(f.read())
+    return solver_hash.hexdigest()
+
+################################################################################
+
+def _get_common_sources(source_paths: Iterable[str]) -> List[str]:
+    """
+    :param source_paths: source file paths
+    :return: source file paths of the common modules imported by the sources,
+    directly or through other common modules, sorted
+    """
+
+    common_paths = set()
+    pending = list(source_paths)
+
+    while pending:
+        with open(pending.pop(), 'rb') as f:
+            source = f.read()
+        for match in COMMON_IMPORT_PATTERN.finditer(source):
+            module_name = (match.group(1) or match.group(2)).decode()
+            common_path = join(ROOT_DIRECTORY, COMMON_PACKAGE_NAME,
+                               module_name + ".py")
+            if common_path not in common_paths and isfile(common_path):
+                common_paths.add(common_path)
+                pending.append(common_path)
+
+    return sorted(common_paths)
+
+################################################################################
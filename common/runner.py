@@ -0,0 +1,242 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from json import dump, load
+from os import makedirs, replace
+from os.path import dirname
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from common import instrumentation
+from common.answers import check_answer
+from common.registry import DAYS, PARTS, get_input_file_path, get_puzzle
+from common.result_cache import ResultCache
+
+"""
+Puzzle runner. Runs single puzzles or all of them in a process pool; the pool
+starts the puzzles that took longest on previous runs first, so the slow ones
+(day 15 part 2, day 11) do not end up running alone at the end. Answers on the
+bundled inputs are checked against the answers stated in the puzzle
+docstrings.
+"""
+
+################################################################################
+
+TIMINGS_FILE_PATH = ".cache/timings.json"
+# (day, part) puzzles whose allocations do not fit in memory when traced on
+# the bundled input (day 15 part 2 needs over 6 GiB); only their RSS is
+# sampled when profiling
+UNTRACEABLE_PUZZLES = {(15, 2)}
+
+KEY_DAY = "day"
+KEY_PART = "part"
+KEY_ANSWER = "answer"
+KEY_SECONDS = "seconds"
+KEY_CACHED = "cached"
+KEY_ERROR = "error"
+KEY_CORRECT = "correct"
+KEY_PHASES = "phases"
+KEY_MEMORY = "memory"
+
+################################################################################
+
+def run_puzzle(day: int, part: int, file_path: Optional[str] = None,
+               use_cache: bool = True, instrument: bool = False,
+               profile: bool = False, trace: bool = True) -> Dict[str, Any]:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :param file_path: puzzle input file path, the bundled input if None
+    :param use_cache: True to use the cached answer if there is one
+    :param instrument: True to record the parse and solve phases of the run
+    :param profile: True to profile the memory usage of the run
+    :param trace: True to trace the allocations when profiling, False to only
+    sample the RSS; never traced for UNTRACEABLE_PUZZLES on the bundled input
+    :return: result with the day, the part, the answer, the running time, if
+    the answer was cached, the error message (None if there was no error), if
+    the answer is correct (None if not known, always for other than the
+    bundled input), the recorded phases (None if not instrumented) and the
+    memory report (None if not profiled, see memory_profiler.profile_memory)
+    """
+
+    result = _create_result(day, part)
+    if instrument:
+        instrumentation.reset()
+        instrumentation.enable()
+    start = perf_counter()
+    bundled = file_path is None
+
+    try:
+        if bundled:
+            file_path = get_input_file_path(day)
+            trace = trace and (day, part) not in UNTRACEABLE_PUZZLES
+        if use_cache:
+            result[KEY_ANSWER] = ResultCache().get(day, part, file_path)
+            result[KEY_CACHED] = result[KEY_ANSWER] is not None
+        if not result[KEY_CACHED]:
+            if profile:
+                # only needed when profiling, tracemalloc and the sampling
+                # thread are not worth importing for every single puzzle run
+                from common.memory_profiler import profile_memory
+                result[KEY_ANSWER], result[KEY_MEMORY] = profile_memory(
+                    get_puzzle(day, part), file_path, trace=trace)
+            else:
+                result[KEY_ANSWER] = get_puzzle(day, part)(file_path)
+            if use_cache:
+                ResultCache().put(day, part, file_path, result[KEY_ANSWER])
+    except Exception as e:
+        result[KEY_ERROR] = "{}: {}".format(type(e).__name__, e)
+
+    result[KEY_SECONDS] = perf_counter() - start
+    if bundled and result[KEY_ERROR] is None:
+        result[KEY_CORRECT] = check_answer(day, part, result[KEY_ANSWER])
+    if instrument:
+        instrumentation.disable()
+        result[KEY_PHASES] = instrumentation.get_statistics()
+    return result
+
+################################################################################
+
+def run_all(days: Iterable[int] = DAYS, workers: Optional[int] = None,
+            use_cache: bool = True, instrument: bool = False,
+            profile: bool = False,
+            trace: bool = True) -> List[Dict[str, Any]]:
+    """
+    Runs all the puzzles of the days on their bundled inputs in a process
+    pool, longest first according to the timings of the previous runs.
+    Puzzles without a previous timing are started first.
+
+    :param days: days to run
+    :param workers: number of worker processes, CPU count if None
+    :param use_cache: True to use the cached answers
+    :param instrument: True to record the parse and solve phases of the runs
+    :param profile: True to profile the memory usage of the runs
+    :param trace: True to trace the allocations when profiling, False to only
+    sample the RSS; never traced for UNTRACEABLE_PUZZLES
+    :return: results (see run_puzzle) ordered by day and part; a puzzle
+    whose worker process died has the error in its result
+    """
+
+    timings = _load_timings()
+    puzzles = sorted(
+        ((day, part) for day in days for part in PARTS),
+        key=lambda puzzle: -timings.get(_get_timing_key(*puzzle),
+                                        float("inf")))
+    arguments = (None, use_cache, instrument, profile, trace)
+
+    results, failed = _run_in_pool(puzzles, workers, arguments)
+    # a dying worker (killed when out of memory etc.) breaks the whole pool;
+    # the puzzles it took down are run again one by one, so only the puzzle
+    # which killed its worker ends up with the error
+    for puzzle in failed:
+        results.extend(_run_in_pool([puzzle], 1, arguments)[0])
+
+    for result in results:
+        # cached answers say nothing about the solving time, traced runs are
+        # much slower than usual
+        if result[KEY_ERROR] is None and not result[KEY_CACHED] \
+                and result[KEY_MEMORY] is None:
+            timings[_get_timing_key(result[KEY_DAY], result[KEY_PART])] \
+                = result[KEY_SECONDS]
+    _save_timings(timings)
+
+    return sorted(results,
+                  key=lambda result: (result[KEY_DAY], result[KEY_PART]))
+
+################################################################################
+
+def _run_in_pool(puzzles: List[Tuple[int, int]], workers: Optional[int],
+                 arguments: Tuple[Any, ...]) \
+        -> Tuple[List[Dict[str, Any]], List[Tuple[int, int]]]:
+    """
+    :param puzzles: (day, part) puzzles, in the order to start them
+    :param workers: number of worker processes, CPU count if None
+    :param arguments: run_puzzle arguments after the day and the part
+    :return: results of the puzzles (see run_puzzle) and the puzzles which
+    failed because the pool broke; a puzzle which failed alone has the error
+    in its result
+    """
+
+    # only needed here, not worth importing for every single puzzle run
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    results = []
+    failed = []
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {executor.submit(run_puzzle, day, part, *arguments):
+                   (day, part)
+                   for day, part in puzzles}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool) and len(puzzles) > 1:
+                    failed.append(futures[future])
+                else:
+                    result = _create_result(*futures[future])
+                    result[KEY_ERROR] = "{}: {}".format(type(e).__name__, e)
+                    results.append(result)
+
+    return results, failed
+
+################################################################################
+
+def _create_result(day: int, part: int) -> Dict[str, Any]:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :return: result of the puzzle with nothing known yet (see run_puzzle)
+    """
+
+    return {
+        KEY_DAY: day,
+        KEY_PART: part,
+        KEY_ANSWER: None,
+        KEY_SECONDS: None,
+        KEY_CACHED: False,
+        KEY_ERROR: None,
+        KEY_CORRECT: None,
+        KEY_PHASES: None,
+        KEY_MEMORY: None
+    }
+
+################################################################################
+
+def _get_timing_key(day: int, part: int) -> str:
+    """
+    :param day: day number
+    :param part: puzzle part
+    :return: key of the puzzle in the timings file
+    """
+
+    return "{}/{}".format(day, part)
+
+################################################################################
+
+def _load_timings() -> Dict[str, float]:
+    """
+    :return: puzzle running times of the previous runs in seconds
+    """
+
+    try:
+        with open(TIMINGS_FILE_PATH, 'r') as f:
+            return load(f)
+    except (OSError, ValueError):
+        return {}
+
+################################################################################
+
+def _save_timings(timings: Dict[str, float]) -> None:
+    """
+    :param timings: puzzle running times in seconds
+    """
+
+    makedirs(dirname(TIMINGS_FILE_PATH), exist_ok=True)
+    temporary_path = "{}.tmp".format(TIMINGS_FILE_PATH)
+    with open(temporary_path, 'w') as f:
+        dump(timings, f, indent=4, sort_keys=True)
+    replace(temporary_path, TIMINGS_FILE_PATH)
+
+################################################################################
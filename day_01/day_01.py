@@ -1,8 +1,14 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from itertools import combinations
 from functools import reduce
+from typing import Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
+from day_01.expense_report_index import ExpenseReportIndex
+from day_01.k_sum import find_k_sum
 
 """
 --- Day 1: Report Repair ---
@@ -25,7 +31,13 @@ first. Each puzzle grants one star. Good luck!
 
 ################################################################################
 
-def puzzle_1() -> None:
+INPUT_FILE_PATH = "day_01/input.txt"
+TARGET = 2020
+
+################################################################################
+
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -53,11 +65,12 @@ def puzzle_1() -> None:
     The answer should be 444019.
     """
 
-    print(_get_product("day_01/input.txt", 2))
+    return _get_product(load_input(file_path, _get_entries), 2)
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -75,27 +88,54 @@ def puzzle_2() -> None:
     The answer should be 29212176.
     """
 
-    print(_get_product("day_01/input.txt", 3))
+    return _get_product(load_input(file_path, _get_entries), 3)
+
+################################################################################
+
+def get_index(file_path: str = INPUT_FILE_PATH) -> ExpenseReportIndex:
+    """
+    :param file_path: input file path
+    :return: index of the expense report, for finding sums with other targets
+    than 2020; built once per input file
+    """
+
+    return load_input(file_path, _create_index)
 
 ################################################################################
 
-def _get_product(file_path: str, count: int) -> int:
+def _get_entries(file_path: str) -> Tuple[int, ...]:
+    """
+    :param file_path: input file path
+    :return: expense report entries
     """
-    Loads numbers from the input file, then finds specified count of numbers
-    which sum is 2020. Returns their product.
 
+    return tuple(int(line) for line in iter_lines(file_path))
+
+################################################################################
+
+def _create_index(file_path: str) -> ExpenseReportIndex:
+    """
     :param file_path: input file path
+    :return: index of the expense report entries
+    """
+
+    return ExpenseReportIndex(load_input(file_path, _get_entries))
+
+################################################################################
+
+@timed()
+def _get_product(entries: Tuple[int, ...], count: int) -> int:
+    """
+    Finds specified count of numbers which sum is 2020. Returns their product.
+
+    :param entries: expense report entries
     :param count: count of the numbers to make the resulting product
     :return: puzzle solution
     """
 
-    with open(file_path, 'r') as f:
-        return reduce(
-            lambda x, y: x * y,
-            [combination
-             for combination in combinations(
-                [int(line.strip())
-                 for line in f.readlines()], count)
-             if sum(combination) == 2020][0])
+    numbers = find_k_sum(entries, TARGET, count)
+    if numbers is None:
+        raise ValueError("No {} entries sum to {}.".format(count, TARGET))
+    return reduce(lambda x, y: x * y, numbers)
 
 ################################################################################
@@ -0,0 +1,116 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from day_01.k_sum import find_k_sum
+
+"""
+Index of an expense report for answering many k-sum queries with different
+targets. Building it takes O(d^2) for d distinct values; then a pair is found
+by one lookup in the map of pair sums, a triple by one lookup per distinct
+value and four entries by one lookup per distinct pair sum.
+"""
+
+################################################################################
+
+class ExpenseReportIndex(object):
+    # pairs of a sum are disjoint unless they are the same pair, so one or two
+    # values can collide with at most two pairs of a sum; with three pairs per
+    # sum, a pair not colliding with them is always among the stored ones
+    PAIRS_PER_SUM = 3
+    # values used more times than this are not needed by the indexed queries
+    MAX_COUNT = 4
+
+################################################################################
+
+    def __init__(self, entries: Iterable[int]):
+        """
+        :param entries: expense report entries
+        """
+
+        self._entries = tuple(entries)
+        self._counts = {value: min(count, self.MAX_COUNT)
+                        for value, count in Counter(self._entries).items()}
+        self._values = sorted(self._counts)
+        self._pairs: Dict[int, List[Tuple[int, int]]] = {}
+
+        for i, first in enumerate(self._values):
+            for second in self._values[i:]:
+                if first == second and self._counts[first] < 2:
+                    continue
+                pairs = self._pairs.setdefault(first + second, [])
+                if len(pairs) < self.PAIRS_PER_SUM:
+                    pairs.append((first, second))
+
+################################################################################
+
+    def find(self, target: int, k: int) -> Optional[Tuple[int, ...]]:
+        """
+        :param target: sum to find
+        :param k: number of entries in the sum, at least 1
+        :return: k entries (at distinct positions) which sum to the target, in
+        ascending order; None if there are no such entries
+        """
+
+        if k == 1:
+            return (target,) if target in self._counts else None
+        elif k == 2:
+            pairs = self._pairs.get(target)
+            return pairs[0] if pairs else None
+        elif k == 3:
+            return self._find_three(target)
+        elif k == 4:
+            return self._find_four(target)
+        else:
+            return find_k_sum(self._entries, target, k)
+
+################################################################################
+
+    def _find_three(self, target: int) -> Optional[Tuple[int, int, int]]:
+        """
+        :param target: sum to find
+        :return: three entries which sum to the target, None if there are none
+        """
+
+        non_negative = not self._values or self._values[0] >= 0
+
+        # the smallest entry of the triple is tried first
+        for value in self._values:
+            if non_negative and 3 * value > target:
+                break
+            for pair in self._pairs.get(target - value, ()):
+                if self._fits((value,) + pair):
+                    return tuple(sorted((value,) + pair))
+
+        return None
+
+################################################################################
+
+    def _find_four(self, target: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        :param target: sum to find
+        :return: four entries which sum to the target, None if there are none
+        """
+
+        for total, pairs in self._pairs.items():
+            for other_pair in self._pairs.get(target - total, ()):
+                for pair in pairs:
+                    if self._fits(pair + other_pair):
+                        return tuple(sorted(pair + other_pair))
+
+        return None
+
+################################################################################
+
+    def _fits(self, values: Tuple[int, ...]) -> bool:
+        """
+        :param values: values
+        :return: True if the report has enough entries of each of the values
+        """
+
+        return all(count <= self._counts[value]
+                   for value, count in Counter(values).items())
+
+################################################################################
@@ -0,0 +1,77 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator
+
+"""
+Generator of expense reports of any size. Exactly one pair and exactly one
+triple of entries sum to 2020; all the other entries are greater than half of
+2020, so no two or three of them can sum to 2020.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 200
+TARGET = 2020
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the expense report to
+    :param size: number of entries, at least 5
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines("{}\n".format(entry)
+                     for entry in _generate_entries(size, Random(seed)))
+
+################################################################################
+
+def _generate_entries(size: int, random: Random) -> Iterator[int]:
+    """
+    :param size: number of entries, at least 5
+    :param random: random numbers generator
+    :return: expense report entries
+    """
+
+    if size < 5:
+        raise ValueError("The expense report needs at least 5 entries.")
+
+    # the triple entries are all smaller than half of the target and the pair
+    # has exactly one smaller entry; three small entries never sum to the
+    # target, the values are checked for that below
+    while True:
+        triple = [random.randrange(600, 700), random.randrange(600, 700)]
+        triple.append(TARGET - sum(triple))
+        pair_small = random.randrange(1, TARGET // 2)
+        smalls = triple + [pair_small]
+        if len(set(smalls)) == len(smalls) \
+                and all(TARGET - pair_small - small not in smalls
+                        for small in triple):
+            break
+
+    pair_big = TARGET - pair_small
+    # big entries completing a pair or a triple with the small ones
+    forbidden = {TARGET - small for small in smalls} \
+        | {TARGET - small_1 - small_2
+           for small_1 in smalls
+           for small_2 in smalls
+           if small_1 != small_2}
+    allowed = [value
+               for value in range(TARGET // 2 + 1, TARGET)
+               if value not in forbidden]
+
+    planted = smalls + [pair_big]
+    positions = set(random.sample(range(size), len(planted)))
+    planted_iterator = iter(random.sample(planted, len(planted)))
+
+    for i in range(size):
+        if i in positions:
+            yield next(planted_iterator)
+        else:
+            yield random.choice(allowed)
+
+################################################################################
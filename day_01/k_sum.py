@@ -0,0 +1,396 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from collections import Counter
+from importlib.util import find_spec
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+"""
+k-sum engine: finds k entries (at distinct positions) which sum to a target.
+
+- k = 2: one pass with a hash set, O(n)
+- k = 3: sort and two pointers, O(n^2); with NumPy installed, big inputs
+  use sorted values and searchsorted over the complements of all the pair
+  sums instead, chunked so that the pair sums do not take O(n^2) memory
+- k >= 4, non-negative values and a small enough target: bounded subset sum
+  over bitsets of the reachable sums, O(n * k^2) shifts of target-bit
+  integers
+- k >= 4 otherwise: meet in the middle; a map of the pair sums (with at most
+  k - 1 pairs per sum), two pairs combined by one lookup per distinct pair
+  sum for every (k - 4)-entries multiset, so O(p) lookups for k = 4 and
+  O(n * p) for k = 5 with p distinct pair sums
+
+Only the multiplicities of the values matter, and no value can be used more
+than k times, so the copies of every value are capped at k first. If all the
+values are non-negative, the values greater than the target are dropped as
+well and the enumerations stop as soon as their sum exceeds the target; with
+a target like 2020, this leaves at most a few thousand values no matter how
+long the expense report is.
+"""
+
+################################################################################
+
+# values left after capping and dropping; smaller inputs are faster in Python
+NUMPY_THRESHOLD = 500
+# pair sums computed at once by the NumPy backend
+NUMPY_CHUNK_SIZE = 1 << 22
+NUMPY_INT_MAX = (1 << 63) - 1
+# bytes the sum bitsets of the bounded subset sum may take
+BOUNDED_MEMORY_LIMIT = 64 * 1024 * 1024
+# NumPy is imported only when its backend is used, it takes longer to import
+# than most of the puzzles take to solve
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+################################################################################
+
+def find_k_sum(values: Iterable[int], target: int, k: int,
+               use_numpy: Optional[bool] = None) -> Optional[Tuple[int, ...]]:
+    """
+    :param values: values to choose from
+    :param target: sum to find
+    :param k: number of values in the sum, at least 1
+    :param use_numpy: True to use the NumPy backend for k = 3, False to use
+    pure Python, None to use NumPy if installed and the input is big enough
+    :return: k values (at distinct positions) which sum to the target, in
+    ascending order; None if there are no such values
+    """
+
+    if k < 1:
+        raise ValueError("At least one value has to be summed.")
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("The NumPy backend needs NumPy installed.")
+
+    counts = _get_counts(values, target, k)
+    if k == 1:
+        return (target,) if target in counts else None
+    elif k == 2:
+        return _find_two_sum(counts, target)
+    elif k == 3:
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE \
+                and sum(counts.values()) >= NUMPY_THRESHOLD \
+                and _fits_int64(counts, target)
+        if use_numpy:
+            return _find_three_sum_numpy(counts, target)
+        return _find_three_sum(counts, target)
+    elif _is_bounded(counts, target, k):
+        return _find_k_sum_bounded(counts, target, k)
+    else:
+        return _find_k_sum_in_the_middle(counts, target, k)
+
+################################################################################
+
+def find_k_sum_streaming(numbers: Iterable[int], target: int, k: int,
+                         non_negative: bool = False) \
+        -> Optional[Tuple[int, ...]]:
+    """
+    Consumes the numbers one by one and stops at the first number completing
+    a sum, so the numbers can be an unbounded feed. Pairs are found with the
+    set of the numbers seen so far, triples with a map of the sums of the
+    pairs seen so far (one pair per sum). The memory depends on the distinct
+    numbers only, not on how many numbers were consumed.
+
+    :param numbers: numbers to choose from
+    :param target: sum to find
+    :param k: number of values in the sum, 2 or 3
+    :param non_negative: True if the numbers are known to be non-negative;
+    numbers and pair sums greater than the target are not kept then, so the
+    memory is bounded by the target as well
+    :return: k numbers (at distinct positions) which sum to the target, in
+    ascending order; None if the numbers ran out before any sum was found
+    """
+
+    if k not in (2, 3):
+        raise ValueError("Only pairs and triples can be streamed.")
+
+    seen = set()
+    pair_sums: Dict[int, Tuple[int, int]] = {}
+
+    for number in numbers:
+        if non_negative and number > target:
+            continue
+        if k == 2:
+            if target - number in seen:
+                return tuple(sorted((number, target - number)))
+        else:
+            pair = pair_sums.get(target - number)
+            if pair is not None:
+                return tuple(sorted(pair + (number,)))
+            # pairs with the other distinct numbers were added by the first
+            # copy of the number already
+            for partner in (number,) if number in seen else seen:
+                total = partner + number
+                if not (non_negative and total > target):
+                    pair_sums.setdefault(total, (partner, number))
+        seen.add(number)
+
+    return None
+
+################################################################################
+
+def _get_counts(values: Iterable[int], target: int, k: int) -> Dict[int, int]:
+    """
+    :param values: values to choose from
+    :param target: sum to find
+    :param k: number of values in the sum
+    :return: counts of the values which can be in the sum, capped at k
+    """
+
+    counts = Counter(values)
+    if counts and min(counts) >= 0:
+        # non-negative values greater than the target cannot be in the sum
+        return {value: min(count, k)
+                for value, count in counts.items()
+                if value <= target}
+    else:
+        return {value: min(count, k) for value, count in counts.items()}
+
+################################################################################
+
+def _find_two_sum(counts: Dict[int, int],
+                  target: int) -> Optional[Tuple[int, int]]:
+    """
+    :param counts: counts of the values
+    :param target: sum to find
+    :return: two values which sum to the target, None if there are none
+    """
+
+    for value in counts:
+        complement = target - value
+        if complement in counts \
+                and (complement != value or counts[value] >= 2):
+            return tuple(sorted((value, complement)))
+
+    return None
+
+################################################################################
+
+def _find_three_sum(counts: Dict[int, int],
+                    target: int) -> Optional[Tuple[int, int, int]]:
+    """
+    :param counts: counts of the values, at most 3 each
+    :param target: sum to find
+    :return: three values which sum to the target, None if there are none
+    """
+
+    values = sorted(value
+                    for value, count in counts.items()
+                    for _ in range(count))
+
+    for i in range(len(values) - 2):
+        if i > 0 and values[i] == values[i - 1]:
+            continue
+        low = i + 1
+        high = len(values) - 1
+        while low < high:
+            total = values[i] + values[low] + values[high]
+            if total == target:
+                return values[i], values[low], values[high]
+            elif total < target:
+                low += 1
+            else:
+                high -= 1
+
+    return None
+
+################################################################################
+
+def _find_three_sum_numpy(counts: Dict[int, int],
+                          target: int) -> Optional[Tuple[int, int, int]]:
+    """
+    For every pair of positions i < j, the last position of the complement
+    target - values[i] - values[j] in the sorted values is found by
+    searchsorted; the triple exists if that position is after j.
+
+    :param counts: counts of the values, at most 3 each
+    :param target: sum to find
+    :return: three values which sum to the target, None if there are none
+    """
+
+    import numpy
+
+    values = numpy.array(sorted(value
+                                for value, count in counts.items()
+                                for _ in range(count)), dtype=numpy.int64)
+    size = len(values)
+    positions = numpy.arange(size)
+    rows = max(1, NUMPY_CHUNK_SIZE // max(size, 1))
+
+    for start in range(0, size, rows):
+        firsts = positions[start:start + rows, numpy.newaxis]
+        # the second positions before the chunk are never after the first one
+        seconds = positions[numpy.newaxis, start:]
+        complements = target - (values[firsts] + values[seconds])
+        lasts = numpy.searchsorted(values, complements, side="right") - 1
+        found = (seconds > firsts) \
+            & (lasts > seconds) \
+            & (values[numpy.maximum(lasts, 0)] == complements)
+        hits = numpy.argwhere(found)
+        if len(hits) > 0:
+            row, column = hits[0]
+            return (int(values[start + row]), int(values[start + column]),
+                    int(values[lasts[row, column]]))
+
+    return None
+
+################################################################################
+
+def _fits_int64(counts: Dict[int, int], target: int) -> bool:
+    """
+    :param counts: counts of the values
+    :param target: sum to find
+    :return: True if no sum of three values (or its difference from the
+    target) can overflow 64-bit integers
+    """
+
+    largest = max([abs(target)] + [abs(value) for value in counts])
+    return 4 * largest <= NUMPY_INT_MAX
+
+################################################################################
+
+def _is_bounded(counts: Dict[int, int], target: int, k: int) -> bool:
+    """
+    :param counts: counts of the values
+    :param target: sum to find
+    :param k: number of values in the sum
+    :return: True if the values and the target are non-negative and the sum
+    bitsets of all the values take at most BOUNDED_MEMORY_LIMIT bytes
+    """
+
+    return target >= 0 and all(value >= 0 for value in counts) \
+        and len(counts) * (k + 1) * (target // 8 + 1) <= BOUNDED_MEMORY_LIMIT
+
+################################################################################
+
+def _find_k_sum_bounded(counts: Dict[int, int], target: int,
+                        k: int) -> Optional[Tuple[int, ...]]:
+    """
+    Bounded subset sum over bitsets: bit s of reachable[j] is set if some j
+    of the values seen so far sum to s, sums above the target are masked off.
+    Every distinct value updates the bitsets with all the copies it has, one
+    shift per copy and count, and the bitsets before every value are kept to
+    recover the values of the sum backwards.
+
+    :param counts: counts of the values, at most k each; all non-negative
+    :param target: sum to find, non-negative
+    :param k: number of values in the sum
+    :return: k values which sum to the target, None if there are none
+    """
+
+    distinct = sorted(counts)
+    mask = (1 << target + 1) - 1
+    reachable = [1] + [0] * k
+    # bitsets before each of the values
+    history = []
+
+    for value in distinct:
+        history.append(reachable)
+        reachable = list(reachable)
+        for j in range(k, 0, -1):
+            for copies in range(1, min(counts[value], j) + 1):
+                reachable[j] |= history[-1][j - copies] << copies * value \
+                    & mask
+        if reachable[k] >> target & 1:
+            break
+    else:
+        return None
+
+    found = []
+    remaining = target
+    for value, before in zip(reversed(distinct[:len(history)]),
+                             reversed(history)):
+        # the fewest copies of the value which leave a reachable rest
+        for copies in range(min(counts[value], k - len(found)) + 1):
+            rest = remaining - copies * value
+            if rest >= 0 and before[k - len(found) - copies] >> rest & 1:
+                found.extend([value] * copies)
+                remaining = rest
+                break
+
+    return tuple(sorted(found))
+
+################################################################################
+
+def _find_k_sum_in_the_middle(counts: Dict[int, int], target: int,
+                              k: int) -> Optional[Tuple[int, ...]]:
+    """
+    Meet in the middle over the distinct pair sums: for every multiset of
+    k - 4 values (only the empty one for k = 4, single values for k = 5),
+    the two pairs completing the sum are found by one lookup per distinct
+    pair sum.
+
+    :param counts: counts of the values, at most k each
+    :param target: sum to find
+    :param k: number of values in the sum, at least 4
+    :return: k values which sum to the target, None if there are none
+    """
+
+    distinct = sorted(counts)
+    non_negative = not distinct or distinct[0] >= 0
+
+    # a pair with a given sum containing a given value is determined by that
+    # value, so at most k - 2 pairs of a sum can collide with the k - 4 values
+    # of the multiset and the other pair; keeping k - 1 pairs per sum is
+    # always enough
+    pairs: Dict[int, List[Tuple[int, int]]] = {}
+    for i, first in enumerate(distinct):
+        for second in distinct[i:]:
+            if non_negative and first + second > target:
+                # the following pair sums are even bigger
+                break
+            if first == second and counts[first] < 2:
+                continue
+            sum_pairs = pairs.setdefault(first + second, [])
+            if len(sum_pairs) < k - 1:
+                sum_pairs.append((first, second))
+    pair_sums = sorted(pairs)
+
+    for multiset in _get_multisets(distinct, counts, k - 4,
+                                   target if non_negative else None):
+        rest = target - sum(multiset)
+        # the smaller pair sum first, the other one is looked up
+        for total in pair_sums:
+            if 2 * total > rest:
+                break
+            for other_pair in pairs.get(rest - total, ()):
+                for pair in pairs[total]:
+                    values = multiset + pair + other_pair
+                    if all(count <= counts[value]
+                           for value, count in Counter(values).items()):
+                        return tuple(sorted(values))
+
+    return None
+
+################################################################################
+
+def _get_multisets(distinct: List[int], counts: Dict[int, int], size: int,
+                   limit: Optional[int], start: int = 0) \
+        -> Iterator[Tuple[int, ...]]:
+    """
+    :param distinct: distinct values in ascending order
+    :param counts: counts of the values
+    :param size: number of values in the multisets
+    :param limit: sum the multisets must not exceed (the values must be
+    non-negative then), None for no limit
+    :param start: index of the smallest value allowed
+    :return: multisets of the values in ascending order, each value taken at
+    most as many times as it is counted
+    """
+
+    if size == 0:
+        yield ()
+        return
+
+    for i in range(start, len(distinct)):
+        value = distinct[i]
+        if limit is not None and value * size > limit:
+            # all the following values are even bigger
+            return
+        for copies in range(1, min(counts[value], size) + 1):
+            head = (value,) * copies
+            remaining_limit = None if limit is None else limit - value * copies
+            for tail in _get_multisets(distinct, counts, size - copies,
+                                       remaining_limit, i + 1):
+                yield head + tail
+
+################################################################################
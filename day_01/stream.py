@@ -0,0 +1,77 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+from functools import reduce
+from sys import stdin
+from typing import Iterable, Iterator, Optional, TextIO
+
+from day_01.day_01 import TARGET
+from day_01.k_sum import find_k_sum_streaming
+
+"""
+Streaming mode of day 1: reads the expense report entries from a stream
+(standard input by default) and prints the product as soon as the entries
+read so far contain a pair (or triple) summing to the target, without waiting
+for the end of the stream.
+
+Usage: python -m day_01.stream [--count 3] [--target 2020] [--non-negative]
+    < entries
+"""
+
+################################################################################
+
+def get_product_streaming(entries: Iterable[int], count: int,
+                          target: int = TARGET,
+                          non_negative: bool = False) -> Optional[int]:
+    """
+    :param entries: expense report entries, read only as far as needed
+    :param count: count of the entries to sum, 2 or 3
+    :param target: sum to find
+    :param non_negative: True if the entries are known to be non-negative;
+    entries and pair sums greater than the target are not kept then
+    :return: product of the first entries found to sum to the target, None if
+    the entries ran out before
+    """
+
+    numbers = find_k_sum_streaming(entries, target, count, non_negative)
+    return None if numbers is None else reduce(lambda x, y: x * y, numbers)
+
+################################################################################
+
+def read_entries(stream: TextIO) -> Iterator[int]:
+    """
+    :param stream: text stream with an entry per line
+    :return: entries, read lazily; blank lines are skipped
+    """
+
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield int(line)
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Streaming day 1 expense report.")
+    parser.add_argument(
+        "--count", type=int, choices=(2, 3), default=2,
+        help="count of the entries to sum")
+    parser.add_argument(
+        "--target", type=int, default=TARGET,
+        help="sum to find")
+    parser.add_argument(
+        "--non-negative", action="store_true",
+        help="the entries are non-negative; keeps less of them in memory")
+    arguments = parser.parse_args()
+
+    product = get_product_streaming(
+        read_entries(stdin), arguments.count, arguments.target,
+        arguments.non_negative)
+    if product is None:
+        raise SystemExit("No {} entries sum to {}.".format(
+            arguments.count, arguments.target))
+    print(product)
+    exit(0)
+
+################################################################################
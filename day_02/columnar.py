@@ -0,0 +1,167 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy
+
+from common.mmap_reader import open_mapped, split_ranges
+from day_02.day_02 import INPUT_FILE_PATH
+
+"""
+Columnar NumPy backend of day 2. The records are parsed into arrays without
+any per-line Python code: the separators ('-' and ' ') are located in the
+whole byte array at once, the policy numbers are assembled digit by digit
+over all the lines together and the passwords are gathered into a zero padded
+uint8 matrix, one row per record. Both policies are then a few vectorized
+comparisons and row sums.
+
+The records must be well formed ("1-3 a: abcde"); passwords must not contain
+the separators. Big files are processed in chunks of about CHUNK_SIZE bytes,
+so the password matrix does not have to hold the whole file.
+"""
+
+################################################################################
+
+CHUNK_SIZE = 16 * 1024 * 1024
+
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+DASH = ord('-')
+SPACE = ord(' ')
+ZERO = ord('0')
+
+################################################################################
+
+@dataclass
+class PasswordColumns(object):
+    number_1: numpy.ndarray
+    number_2: numpy.ndarray
+    letter: numpy.ndarray
+    passwords: numpy.ndarray
+    lengths: numpy.ndarray
+
+    def count_valid(self) -> Tuple[int, int]:
+        """
+        :return: counts of the passwords valid according to the first and the
+        second policy
+        """
+
+        letter = self.letter[:, numpy.newaxis]
+        letter_count = numpy.sum(self.passwords == letter, axis=1)
+        valid_1 = (self.number_1 <= letter_count) \
+            & (letter_count <= self.number_2)
+
+        # positions counted from 1, outside of the password never match
+        rows = numpy.arange(len(self.lengths))
+        width = self.passwords.shape[1]
+        matches = []
+        for number in (self.number_1, self.number_2):
+            position = number - 1
+            inside = (position >= 0) & (position < self.lengths)
+            character = self.passwords[
+                rows, numpy.clip(position, 0, max(width - 1, 0))] \
+                if width > 0 else numpy.zeros(len(rows), numpy.uint8)
+            matches.append(inside & (character == self.letter))
+        valid_2 = matches[0] != matches[1]
+
+        return int(numpy.count_nonzero(valid_1)), \
+            int(numpy.count_nonzero(valid_2))
+
+################################################################################
+
+def count_valid_columnar(file_path: str = INPUT_FILE_PATH) -> Tuple[int, int]:
+    """
+    :param file_path: file path with the password database
+    :return: counts of the passwords valid according to the first and the
+    second policy
+    """
+
+    valid_count_1 = 0
+    valid_count_2 = 0
+
+    with open_mapped(file_path) as mapped:
+        for start, end in split_ranges(
+                file_path, max(1, len(mapped) // CHUNK_SIZE)):
+            count_1, count_2 = parse_columns(
+                numpy.frombuffer(mapped, numpy.uint8, end - start, start)) \
+                .count_valid()
+            valid_count_1 += count_1
+            valid_count_2 += count_2
+
+    return valid_count_1, valid_count_2
+
+################################################################################
+
+def parse_columns(data: numpy.ndarray) -> PasswordColumns:
+    """
+    :param data: password database bytes, whole lines only
+    :return: columns of the records
+    """
+
+    # line boundaries; a missing newline at the end is added virtually
+    line_ends = numpy.flatnonzero(data == NEWLINE)
+    if len(data) > 0 and data[-1] != NEWLINE:
+        line_ends = numpy.append(line_ends, len(data))
+    line_starts = numpy.concatenate(([0], line_ends[:-1] + 1)) \
+        .astype(numpy.int64)
+    password_ends = line_ends.copy()
+    has_carriage_return = numpy.zeros(len(line_ends), bool)
+    not_empty = password_ends > line_starts
+    has_carriage_return[not_empty] = \
+        data[password_ends[not_empty] - 1] == CARRIAGE_RETURN
+    password_ends -= has_carriage_return
+
+    # blank lines are no records
+    records = password_ends > line_starts
+    line_starts = line_starts[records]
+    password_ends = password_ends[records]
+
+    # one dash and two spaces per record, in order
+    dashes = numpy.flatnonzero(data == DASH)
+    spaces = numpy.flatnonzero(data == SPACE)
+    if len(dashes) != len(line_starts) or len(spaces) != 2 * len(line_starts):
+        raise ValueError("Malformed password database records.")
+    spaces = spaces.reshape(-1, 2)
+
+    number_1 = _parse_numbers(data, line_starts, dashes)
+    number_2 = _parse_numbers(data, dashes + 1, spaces[:, 0])
+    letter = data[spaces[:, 0] + 1]
+    password_starts = spaces[:, 1] + 1
+    lengths = password_ends - password_starts
+
+    width = int(lengths.max()) if len(lengths) > 0 else 0
+    indexes = password_starts[:, numpy.newaxis] + numpy.arange(width)
+    inside = indexes < password_ends[:, numpy.newaxis]
+    passwords = numpy.where(
+        inside, data[numpy.minimum(indexes, len(data) - 1)], 0) \
+        .astype(numpy.uint8)
+
+    return PasswordColumns(number_1, number_2, letter, passwords, lengths)
+
+################################################################################
+
+def _parse_numbers(data: numpy.ndarray, starts: numpy.ndarray,
+                   ends: numpy.ndarray) -> numpy.ndarray:
+    """
+    :param data: bytes
+    :param starts: offsets of the first digits of the numbers
+    :param ends: offsets after the last digits of the numbers
+    :return: the numbers
+    """
+
+    numbers = numpy.zeros(len(starts), numpy.int64)
+    widths = ends - starts
+    # digits from the most significant one, all the numbers at once
+    for digit in range(int(widths.max()) if len(widths) > 0 else 0):
+        has_digit = digit < widths
+        numbers = numpy.where(
+            has_digit,
+            numbers * 10 + data[numpy.where(has_digit, starts + digit, 0)]
+            - ZERO,
+            numbers)
+
+    return numbers
+
+################################################################################
@@ -1,6 +1,14 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
+from mmap import mmap
+from re import MULTILINE, compile
+from typing import Dict, Optional, Tuple, Union
+
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import open_mapped
+
 """
 --- Day 2: Password Philosophy ---
 
@@ -18,7 +26,19 @@ effect when they were chosen.
 
 ################################################################################
 
-def puzzle_1() -> None:
+INPUT_FILE_PATH = "day_02/input.txt"
+# "1-3 a: abcde": policy and password on a line of their own; any other
+# non-blank line is matched as the third group, so it cannot go unnoticed
+RECORD_PATTERN = compile(
+    rb"^[ \t]*(?:(\d+-\d+ \S)[ \t]*:[ \t]*(\S*)[ \t\r]*|(.*\S.*))$",
+    MULTILINE)
+
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+################################################################################
+
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -47,27 +67,12 @@ def puzzle_1() -> None:
     The answer should be 506.
     """
 
-    with open("day_02/input.txt", 'r') as f:
-        valid_count = 0
-
-        for line in f.readlines():
-            line_parts = line.split(':')
-            password = line_parts[1].strip()
-            policy_parts = line_parts[0].strip().split(' ')
-            letter = policy_parts[1].strip()
-            letter_range_parts = policy_parts[0].strip().split('-')
-            letter_range_min = int(letter_range_parts[0].strip())
-            letter_range_max = int(letter_range_parts[1].strip())
-            letter_count = password.count(letter)
-
-            if letter_range_min <= letter_count <= letter_range_max:
-                valid_count += 1
-
-        print(valid_count)
+    return load_input(file_path, _get_valid_counts)[0]
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -97,25 +102,62 @@ def puzzle_2() -> None:
     The answer should be 443.
     """
 
-    with open("day_02/input.txt", 'r') as f:
-        valid_count = 0
-
-        for line in f.readlines():
-            line_parts = line.split(':')
-            password = line_parts[1].strip()
-            policy_parts = line_parts[0].strip().split(' ')
-            letter = policy_parts[1].strip()
-            letter_positions = [int(position.strip()) - 1
-                                for position in
-                                policy_parts[0].strip().split('-')]
-
-            # (a and not b) or (not a and b)
-            if (password[letter_positions[0]] == letter
-                and password[letter_positions[1]] != letter) \
-                    or (password[letter_positions[0]] != letter
-                        and password[letter_positions[1]] == letter):
-                valid_count += 1
-
-        print(valid_count)
+    return load_input(file_path, _get_valid_counts)[1]
+
+################################################################################
+
+def _get_valid_counts(file_path: str) -> Tuple[int, int]:
+    """
+    :param file_path: file path with the password database
+    :return: counts of the passwords valid according to the first and the
+    second policy
+    """
+
+    with open_mapped(file_path) as mapped:
+        return count_valid(mapped)
+
+################################################################################
+
+def count_valid(data: Buffer, start: int = 0,
+                end: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Parses the password database records in one pass and checks both
+    policies on every record. There are only a few thousand distinct
+    policies, so each one is parsed once and then looked up.
+
+    :param data: password database (bytes, mmap etc.)
+    :param start: offset to start at, at the beginning of a record
+    :param end: offset to end at, after the end of a record; end of the data
+    if None
+    :return: counts of the passwords valid according to the first and the
+    second policy; ValueError if a non-blank line is not a record
+    """
+
+    valid_count_1 = 0
+    valid_count_2 = 0
+    policies: Dict[bytes, Tuple[int, int, bytes]] = {}
+
+    for match in RECORD_PATTERN.finditer(
+            data, start, len(data) if end is None else end):
+        policy, password, malformed = match.groups()
+        if malformed is not None:
+            raise ValueError(
+                "Malformed password database record at offset {}: {!r}".format(
+                    match.start(3), malformed.decode(errors="replace")))
+        try:
+            number_1, number_2, letter = policies[policy]
+        except KeyError:
+            numbers, letter = policy.split(b' ')
+            number_1, number_2 = (int(number) for number in numbers.split(b'-'))
+            policies[policy] = number_1, number_2, letter
+
+        if number_1 <= password.count(letter) <= number_2:
+            valid_count_1 += 1
+        # exactly one of the positions (counted from 1) contains the letter
+        if (password[number_1 - 1:number_1] == letter) \
+                != (password[number_2 - 1:number_2] == letter):
+            valid_count_2 += 1
+
+    return valid_count_1, valid_count_2
 
 ################################################################################
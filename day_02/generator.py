@@ -0,0 +1,54 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from string import ascii_lowercase
+from typing import Iterator
+
+"""
+Generator of password databases of any size.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 1000
+MAX_PASSWORD_LENGTH = 20
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the password database to
+    :param size: number of passwords
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_lines(size, Random(seed)))
+
+################################################################################
+
+def _generate_lines(size: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of passwords
+    :param random: random numbers generator
+    :return: password database lines
+    """
+
+    for _ in range(size):
+        letter = random.choice(ascii_lowercase)
+        letter_range_min = random.randint(1, MAX_PASSWORD_LENGTH - 1)
+        letter_range_max = random.randint(
+            letter_range_min + 1, MAX_PASSWORD_LENGTH)
+        # the password is always long enough for both letter positions
+        password_length = random.randint(
+            letter_range_max, MAX_PASSWORD_LENGTH)
+        # bias the passwords towards the policy letter so that both valid and
+        # invalid passwords are common
+        password = ''.join(
+            letter if random.random() < 0.3 else random.choice(ascii_lowercase)
+            for _ in range(password_length))
+        yield "{}-{} {}: {}\n".format(
+            letter_range_min, letter_range_max, letter, password)
+
+################################################################################
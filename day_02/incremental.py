@@ -0,0 +1,196 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+from hashlib import sha256
+from json import dump, load
+from os import makedirs, replace
+from os.path import abspath, dirname
+from time import sleep
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from common.mmap_reader import NEWLINE, open_mapped
+from day_02.day_02 import INPUT_FILE_PATH, count_valid
+
+"""
+Incremental mode of day 2 for append-only password databases. A checkpoint
+file keeps the offset after the last complete line checked so far and the
+valid counts of both policies up to it; the next update checks only the
+lines appended since. A line without its newline yet is left for the next
+update. The checkpoint also keeps a hash of the bytes just before the offset;
+if the file shrank or those bytes changed (the file was truncated or
+replaced), the counts start from the beginning again.
+
+Usage: python -m day_02.incremental [--follow] [--interval 1] [FILE_PATH]
+"""
+
+################################################################################
+
+CHECKPOINT_FILE_PATH = ".cache/day_02_checkpoint.json"
+FOLLOW_INTERVAL = 1.0
+# bytes before the offset hashed to recognize the same file
+TAIL_SIZE = 4096
+
+KEY_FILE_PATH = "file_path"
+KEY_OFFSET = "offset"
+KEY_TAIL_HASH = "tail_hash"
+KEY_VALID_COUNTS = "valid_counts"
+
+################################################################################
+
+class IncrementalValidator(object):
+
+    def __init__(self, file_path: str = INPUT_FILE_PATH,
+                 checkpoint_file_path: str = CHECKPOINT_FILE_PATH):
+        """
+        :param file_path: file path with the password database
+        :param checkpoint_file_path: file path of the checkpoint
+        """
+
+        self._file_path = file_path
+        self._checkpoint_file_path = checkpoint_file_path
+
+################################################################################
+
+    def update(self) -> Tuple[int, int]:
+        """
+        Checks the lines appended since the checkpoint and moves it.
+
+        :return: counts of the passwords valid according to the first and the
+        second policy, for all the complete lines of the file
+        """
+
+        checkpoint = self._load_checkpoint()
+
+        with open_mapped(self._file_path) as mapped:
+            offset = checkpoint[KEY_OFFSET]
+            valid_count_1, valid_count_2 = checkpoint[KEY_VALID_COUNTS]
+            if offset > len(mapped) \
+                    or _get_tail_hash(mapped, offset) \
+                    != checkpoint[KEY_TAIL_HASH]:
+                offset = 0
+                valid_count_1 = valid_count_2 = 0
+
+            end = mapped.rfind(NEWLINE, offset) + 1
+            if end > offset:
+                count_1, count_2 = count_valid(mapped, offset, end)
+                valid_count_1 += count_1
+                valid_count_2 += count_2
+                offset = end
+
+            self._save_checkpoint({
+                KEY_FILE_PATH: abspath(self._file_path),
+                KEY_OFFSET: offset,
+                KEY_TAIL_HASH: _get_tail_hash(mapped, offset),
+                KEY_VALID_COUNTS: [valid_count_1, valid_count_2]
+            })
+
+        return valid_count_1, valid_count_2
+
+################################################################################
+
+    def follow(self, callback: Callable[[Tuple[int, int]], Any],
+               interval: float = FOLLOW_INTERVAL,
+               updates: Optional[int] = None) -> None:
+        """
+        Keeps updating the counts; the callback gets the counts after the
+        first update and after every update which changed them.
+
+        :param callback: function called with the counts
+        :param interval: seconds between the updates
+        :param updates: number of updates, forever if None
+        """
+
+        counts = None
+        update = 0
+
+        while updates is None or update < updates:
+            if update > 0:
+                sleep(interval)
+            new_counts = self.update()
+            if new_counts != counts:
+                counts = new_counts
+                callback(counts)
+            update += 1
+
+################################################################################
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """
+        :return: checkpoint of the file; the beginning of the file if there
+        is no checkpoint or it belongs to another file
+        """
+
+        try:
+            with open(self._checkpoint_file_path, 'r') as f:
+                checkpoint = load(f)
+            if checkpoint[KEY_FILE_PATH] == abspath(self._file_path):
+                return checkpoint
+        except (OSError, ValueError, KeyError):
+            pass
+
+        return {
+            KEY_FILE_PATH: abspath(self._file_path),
+            KEY_OFFSET: 0,
+            KEY_TAIL_HASH: _get_tail_hash(b'', 0),
+            KEY_VALID_COUNTS: [0, 0]
+        }
+
+################################################################################
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """
+        :param checkpoint: checkpoint to save
+        """
+
+        directory = dirname(self._checkpoint_file_path)
+        if directory:
+            makedirs(directory, exist_ok=True)
+        temporary_path = "{}.tmp".format(self._checkpoint_file_path)
+        with open(temporary_path, 'w') as f:
+            dump(checkpoint, f, indent=4)
+        replace(temporary_path, self._checkpoint_file_path)
+
+################################################################################
+
+def _get_tail_hash(data: Any, offset: int) -> str:
+    """
+    :param data: file content (bytes, mmap etc.)
+    :param offset: offset
+    :return: SHA-256 of the bytes just before the offset
+    """
+
+    return sha256(data[max(offset - TAIL_SIZE, 0):offset]).hexdigest()
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Incremental day 2 password checks.")
+    parser.add_argument(
+        "--follow", action="store_true",
+        help="keep checking the appended lines and print the changed counts")
+    parser.add_argument(
+        "--interval", type=float, default=FOLLOW_INTERVAL,
+        help="seconds between the checks when following")
+    parser.add_argument(
+        "--checkpoint", dest="checkpoint_file_path",
+        default=CHECKPOINT_FILE_PATH,
+        help="checkpoint file path")
+    parser.add_argument(
+        "file_path", nargs='?', default=INPUT_FILE_PATH,
+        help="password database file path; the bundled input.txt if omitted")
+    arguments = parser.parse_args()
+
+    validator = IncrementalValidator(
+        arguments.file_path, arguments.checkpoint_file_path)
+    if arguments.follow:
+        try:
+            validator.follow(
+                lambda counts: print(*counts, flush=True), arguments.interval)
+        except KeyboardInterrupt:
+            pass
+    else:
+        print(*validator.update(), sep='\n')
+    exit(0)
+
+################################################################################
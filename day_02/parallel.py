@@ -0,0 +1,81 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Optional, Tuple
+
+from common.mmap_reader import open_mapped, split_ranges
+from day_02.day_02 import INPUT_FILE_PATH, count_valid
+
+"""
+Parallel mode of day 2 for huge password databases. The file is split into
+byte ranges ending at line ends and every worker process maps the file and
+checks the records of its range only, so no process reads the whole file;
+the counts of the ranges are then summed.
+
+Usage: python -m day_02.parallel [--workers 8] [FILE_PATH]
+"""
+
+################################################################################
+
+# ranges per worker, so that the workers finish at about the same time
+RANGES_PER_WORKER = 4
+
+################################################################################
+
+def count_valid_parallel(file_path: str = INPUT_FILE_PATH,
+                         workers: Optional[int] = None) -> Tuple[int, int]:
+    """
+    :param file_path: file path with the password database
+    :param workers: number of worker processes, CPU count if None
+    :return: counts of the passwords valid according to the first and the
+    second policy
+    """
+
+    workers = workers or cpu_count() or 1
+    ranges = split_ranges(file_path, workers * RANGES_PER_WORKER)
+
+    with ProcessPoolExecutor(workers) as executor:
+        counts = list(executor.map(
+            _count_valid_in_range,
+            [file_path] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges]))
+
+    return sum(count_1 for count_1, _ in counts), \
+        sum(count_2 for _, count_2 in counts)
+
+################################################################################
+
+def _count_valid_in_range(file_path: str, start: int,
+                          end: int) -> Tuple[int, int]:
+    """
+    :param file_path: file path with the password database
+    :param start: offset of the range, at the beginning of a line
+    :param end: offset after the range, after the end of a line
+    :return: counts of the passwords in the range valid according to the
+    first and the second policy
+    """
+
+    with open_mapped(file_path) as mapped:
+        return count_valid(mapped, start, end)
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Parallel day 2 password checks.")
+    parser.add_argument(
+        "--workers", type=int,
+        help="number of worker processes; CPU count if omitted")
+    parser.add_argument(
+        "file_path", nargs='?', default=INPUT_FILE_PATH,
+        help="password database file path; the bundled input.txt if omitted")
+    arguments = parser.parse_args()
+
+    for count in count_valid_parallel(arguments.file_path, arguments.workers):
+        print(count)
+    exit(0)
+
+################################################################################
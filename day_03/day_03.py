@@ -1,9 +1,13 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from typing import Dict
+from typing import Dict, Tuple
 from functools import reduce
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+from day_03.tree_grid import TreeGrid
+
 """
 --- Day 3: Toboggan Trajectory ---
 
@@ -15,6 +19,7 @@ take you near the fewest trees.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_03/input.txt"
 TREE = '#'
 KEY_RIGHT = "RIGHT"
 KEY_DOWN = "DOWN"
@@ -38,7 +43,8 @@ SLOPES = [{
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -109,11 +115,13 @@ def puzzle_1() -> None:
     The answer should be 257.
     """
 
-    print(_get_trees_count_in_slope(SLOPES[1]))
+    return load_input(file_path, TreeGrid).count_trees(
+        [_get_slope(SLOPES[1])])[0]
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
     Time to check the rest of the slopes - you need to minimize the probability
@@ -138,26 +146,18 @@ def puzzle_2() -> None:
     The answer should be 1744787392.
     """
 
-    print(reduce(lambda x, y: x * y, [_get_trees_count_in_slope(slope)
-                                      for slope in SLOPES]))
+    return reduce(lambda x, y: x * y,
+                  load_input(file_path, TreeGrid).count_trees(
+                      [_get_slope(slope) for slope in SLOPES]))
 
 ################################################################################
 
-def _get_trees_count_in_slope(slope: Dict[str, int]) -> int:
+def _get_slope(slope: Dict[str, int]) -> Tuple[int, int]:
     """
-    Counts number of trees in the specified slope.
-
     :param slope: how many squares to move right and down
-    :return: number of trees in the specified slope
+    :return: (right, down) slope
     """
 
-    with open("day_03/input.txt", 'r') as f:
-        lines = [line.strip() for line in f.readlines()]
-        lines_in_slope = [lines[i]
-                          for i in range(len(lines))
-                          if i % slope[KEY_DOWN] == 0]
-        return(len([i for i in range(len(lines_in_slope))
-                    if lines_in_slope[i]
-                    [i * slope[KEY_RIGHT] % len(lines_in_slope[i])] == TREE]))
+    return slope[KEY_RIGHT], slope[KEY_DOWN]
 
 ################################################################################
@@ -0,0 +1,49 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator
+
+from day_03.day_03 import TREE
+
+"""
+Generator of tree maps of any height.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 323
+WIDTH = 31
+OPEN_SQUARE = '.'
+TREE_PROBABILITY = 0.2
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0,
+             width: int = WIDTH) -> None:
+    """
+    :param file_path: file path to write the map to
+    :param size: number of rows
+    :param seed: random seed
+    :param width: number of columns
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_rows(size, width, Random(seed)))
+
+################################################################################
+
+def _generate_rows(size: int, width: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of rows
+    :param width: number of columns
+    :param random: random numbers generator
+    :return: map rows
+    """
+
+    for _ in range(size):
+        yield ''.join(TREE if random.random() < TREE_PROBABILITY
+                      else OPEN_SQUARE
+                      for _ in range(width)) + '\n'
+
+################################################################################
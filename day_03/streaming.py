@@ -0,0 +1,124 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, \
+    Tuple, Union
+
+from common.mmap_reader import CARRIAGE_RETURN, NEWLINE, open_mapped
+
+"""
+Streaming traversal of day 3 for maps too tall to keep in memory. The rows
+are read lazily and all the slopes advance together: every slope keeps the
+next row it lands on and its column there, rows no slope lands on are
+skipped without being looked at, and only the current row is held, so the
+memory is O(width + slopes) whatever the height of the map. In a file, the
+skipped rows are only searched for their line ends in the memory-mapped file.
+"""
+
+################################################################################
+
+TREE = ord('#')
+LINE_ENDINGS = CARRIAGE_RETURN + NEWLINE
+
+################################################################################
+
+def count_trees_in_file(file_path: str,
+                        slopes: Sequence[Tuple[int, int]]) -> List[int]:
+    """
+    :param file_path: file path with the map
+    :param slopes: (right, down) slopes, down at least 1
+    :return: number of trees encountered on each of the slopes, starting at
+    the top left corner
+    """
+
+    with open_mapped(file_path) as mapped:
+        offset = 0
+
+        def read_row(skip: int) -> Optional[bytes]:
+            nonlocal offset
+            while offset < len(mapped):
+                line_end = mapped.find(NEWLINE, offset)
+                if line_end == -1:
+                    line_end = len(mapped)
+                if line_end > offset:
+                    # blank lines are no rows
+                    if skip == 0:
+                        row = mapped[offset:line_end]
+                        offset = line_end + 1
+                        return row.rstrip(CARRIAGE_RETURN)
+                    skip -= 1
+                offset = line_end + 1
+            return None
+
+        return _traverse(read_row, slopes)
+
+################################################################################
+
+def count_trees_streaming(rows: Iterable[Union[bytes, str]],
+                          slopes: Sequence[Tuple[int, int]]) -> List[int]:
+    """
+    :param rows: map rows (bytes or str), read only as far as the slopes
+    need; line endings are stripped and blank lines skipped, so the lines of
+    an open file can be passed directly
+    :param slopes: (right, down) slopes, down at least 1
+    :return: number of trees encountered on each of the slopes, starting at
+    the top left corner
+    """
+
+    rows = iter(_normalize_rows(rows))
+    return _traverse(lambda skip: next(islice(rows, skip, None), None), slopes)
+
+################################################################################
+
+def _normalize_rows(rows: Iterable[Union[bytes, str]]) -> Iterator[bytes]:
+    """
+    :param rows: map rows (bytes or str), line endings allowed
+    :return: map rows as bytes without the line endings, blank lines skipped
+    """
+
+    for row in rows:
+        if isinstance(row, str):
+            row = row.encode()
+        elif not isinstance(row, (bytes, bytearray)):
+            raise TypeError("Map rows must be bytes or str, not {}.".format(
+                type(row).__name__))
+        row = row.rstrip(LINE_ENDINGS)
+        if row:
+            yield row
+
+################################################################################
+
+def _traverse(read_row: Callable[[int], Optional[bytes]],
+              slopes: Sequence[Tuple[int, int]]) -> List[int]:
+    """
+    :param read_row: function skipping the specified number of rows and
+    returning the next one, None at the end of the map
+    :param slopes: (right, down) slopes, down at least 1
+    :return: number of trees encountered on each of the slopes, starting at
+    the top left corner
+    """
+
+    counts = [0] * len(slopes)
+    next_rows = [0] * len(slopes)
+    columns = [0] * len(slopes)
+    current = 0
+
+    while slopes:
+        landing = min(next_rows)
+        row = read_row(landing - current)
+        if row is None:
+            break
+        current = landing + 1
+
+        width = len(row)
+        for i, (right, down) in enumerate(slopes):
+            if next_rows[i] == landing:
+                if row[columns[i]] == TREE:
+                    counts[i] += 1
+                columns[i] = (columns[i] + right) % width
+                next_rows[i] += down
+
+    return counts
+
+################################################################################
@@ -0,0 +1,175 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from typing import Dict, Sequence, Tuple
+
+import numpy
+
+from common.instrumentation import timed
+
+"""
+NumPy backend of day 3 for querying many slopes on the same map. The map is a
+boolean array (True for a tree) and the slopes are grouped by how many rows
+they go down; such a slope takes ceil(height / down) steps. The columns of
+the steps repeat with a period of width steps, so for a map taller than wide
+the trees of the visited rows are summed per column and per step residue
+modulo the width once for each down, after which any slope takes width
+lookups. For maps with fewer steps than columns, the visited squares of all
+the slopes are looked up directly. Slopes are processed in chunks of
+CHUNK_SIZE looked up squares.
+"""
+
+################################################################################
+
+CHUNK_SIZE = 1 << 24
+TREE = ord('#')
+
+################################################################################
+
+class TreeArray(object):
+
+    def __init__(self, file_path: str):
+        """
+        :param file_path: file path with the map
+        """
+
+        with open(file_path, 'rb') as f:
+            # no whitespace inside the rows, line endings of any kind
+            rows = f.read().split()
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("The map rows differ in width.")
+
+        self._trees = numpy.frombuffer(b''.join(rows), numpy.uint8) \
+            .reshape(len(rows), width) == TREE
+        self._residue_sums: Dict[int, numpy.ndarray] = {}
+
+################################################################################
+
+    @property
+    def trees(self) -> numpy.ndarray:
+        """
+        :return: (height, width) boolean array, True where there is a tree
+        """
+
+        return self._trees
+
+################################################################################
+
+    @timed()
+    def count_trees(self, slopes: Sequence[Tuple[int, int]]) -> numpy.ndarray:
+        """
+        :param slopes: (right, down) slopes, down at least 1
+        :return: number of trees encountered on each of the slopes, starting
+        at the top left corner
+        """
+
+        slopes = numpy.asarray(slopes, numpy.int64).reshape(-1, 2)
+        height, width = self._trees.shape
+        counts = numpy.zeros(len(slopes), numpy.int64)
+        if height == 0 or width == 0:
+            return counts
+
+        for down in numpy.unique(slopes[:, 1]):
+            selected = numpy.flatnonzero(slopes[:, 1] == down)
+            rights = slopes[selected, 0] % width
+            # steps of the slopes going down by the same number of rows
+            steps = -(-height // int(down))
+            if steps >= width:
+                counts[selected] = self._count_by_residues(int(down), rights)
+            else:
+                counts[selected] = self._count_by_steps(int(down), rights)
+
+        return counts
+
+################################################################################
+
+    def _count_by_residues(self, down: int,
+                           rights: numpy.ndarray) -> numpy.ndarray:
+        """
+        Step k of a slope is in column k * right % width, which depends on k
+        modulo the width only. All the steps with the same residue are summed
+        per column first, once for all the slopes going down by the same
+        number of rows, so a slope then costs width lookups, not a lookup per
+        visited row.
+
+        :param down: rows down of the slopes, at most height / width
+        :param rights: columns right of the slopes, modulo the width
+        :return: number of trees encountered on each of the slopes
+        """
+
+        width = self._trees.shape[1]
+        residues = self._get_residue_sums(down)
+        steps = numpy.arange(width, dtype=numpy.int64)
+        chunk = max(1, CHUNK_SIZE // width)
+        counts = numpy.empty(len(rights), numpy.int64)
+
+        for start in range(0, len(rights), chunk):
+            columns = rights[start:start + chunk, numpy.newaxis] * steps \
+                % width
+            counts[start:start + chunk] = residues[steps, columns].sum(axis=1)
+
+        return counts
+
+################################################################################
+
+    def _count_by_steps(self, down: int,
+                        rights: numpy.ndarray) -> numpy.ndarray:
+        """
+        :param down: rows down of the slopes, more than height / width
+        :param rights: columns right of the slopes, modulo the width
+        :return: number of trees encountered on each of the slopes
+        """
+
+        height, width = self._trees.shape
+        visited = self._trees[::down]
+        steps = numpy.arange(len(visited), dtype=numpy.int64)
+        chunk = max(1, CHUNK_SIZE // len(visited))
+        counts = numpy.empty(len(rights), numpy.int64)
+
+        for start in range(0, len(rights), chunk):
+            # fewer steps than columns, no column is visited twice
+            columns = rights[start:start + chunk, numpy.newaxis] * steps \
+                % width
+            counts[start:start + chunk] = visited[steps, columns].sum(axis=1)
+
+        return counts
+
+################################################################################
+
+    def _get_residue_sums(self, down: int) -> numpy.ndarray:
+        """
+        :param down: rows down of the slopes
+        :return: (width, width) array, trees in each column of the rows
+        visited by the steps k with each residue k % width, for the steps
+        going down by the number of rows
+        """
+
+        try:
+            return self._residue_sums[down]
+        except KeyError:
+            width = self._trees.shape[1]
+            visited = self._trees[::down]
+            whole = len(visited) // width * width
+            residue_sums = visited[:whole].reshape(-1, width, width) \
+                .sum(axis=0, dtype=numpy.int64)
+            residue_sums[:len(visited) - whole] += visited[whole:]
+            self._residue_sums[down] = residue_sums
+            return residue_sums
+
+################################################################################
+
+    def find_best_slope(self, slopes: Sequence[Tuple[int, int]]) \
+            -> Tuple[Tuple[int, int], numpy.ndarray]:
+        """
+        :param slopes: (right, down) slopes, down at least 1; not empty
+        :return: slope with the fewest trees (the first one of those with the
+        same count) and the number of trees of each of the slopes
+        """
+
+        counts = self.count_trees(slopes)
+        best = int(numpy.argmin(counts))
+        right, down = slopes[best]
+        return (int(right), int(down)), counts
+
+################################################################################
@@ -0,0 +1,107 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from typing import Dict, List, Sequence, Tuple
+
+from common.instrumentation import timed
+
+"""
+Map of the trees, parsed once into a bitset per column (bit i set if there is
+a tree in row i of the column). A slope (right, down) visits row k * down in
+column k * right % width, so the visited columns repeat with a period of width
+steps: all the rows visited in a column are one periodic bit mask. Counting
+the trees of a slope is then one AND and one popcount per column over all the
+rows at once, for any number of slopes, instead of a Python step per row.
+"""
+
+################################################################################
+
+class TreeGrid(object):
+    TREE = b'#'
+    OPEN = b'.'
+    # map rows to the binary digits of the bitsets
+    BITS = bytes.maketrans(TREE + OPEN, b'10')
+
+################################################################################
+
+    def __init__(self, file_path: str):
+        """
+        :param file_path: file path with the map
+        """
+
+        with open(file_path, 'rb') as f:
+            # no whitespace inside the rows, line endings of any kind
+            rows = f.read().split()
+        self._width = len(rows[0]) if rows else 0
+        self._height = len(rows)
+        if any(len(row) != self._width for row in rows):
+            raise ValueError("The map rows differ in width.")
+
+        # the first row is the lowest bit, hence the reversed column
+        digits = b''.join(rows).translate(self.BITS)
+        self._columns = tuple(int(digits[j::self._width][::-1], 2)
+                              for j in range(self._width))
+        self._masks: Dict[int, int] = {}
+
+################################################################################
+
+    @property
+    def width(self) -> int:
+        """
+        :return: number of columns of the map before it repeats
+        """
+
+        return self._width
+
+################################################################################
+
+    @property
+    def height(self) -> int:
+        """
+        :return: number of rows of the map
+        """
+
+        return self._height
+
+################################################################################
+
+    @timed()
+    def count_trees(self, slopes: Sequence[Tuple[int, int]]) -> List[int]:
+        """
+        :param slopes: (right, down) slopes, down at least 1
+        :return: number of trees encountered on each of the slopes, starting
+        at the top left corner
+        """
+
+        if self._width == 0:
+            return [0] * len(slopes)
+
+        counts = []
+        for right, down in slopes:
+            # rows of the steps k = step, step + width, step + 2 * width...
+            mask = self._get_mask(self._width * down)
+            counts.append(sum(
+                (self._columns[step * right % self._width] >> step * down
+                 & mask).bit_count()
+                for step in range(min(self._width, self._height))))
+
+        return counts
+
+################################################################################
+
+    def _get_mask(self, period: int) -> int:
+        """
+        :param period: distance of the bits
+        :return: bits 0, period, 2 * period... up to the height of the map
+        """
+
+        try:
+            return self._masks[period]
+        except KeyError:
+            repeats = -(-self._height // period)
+            # 1 + 2^period + 2^(2 * period) + ... as a geometric series
+            mask = ((1 << period * repeats) - 1) // ((1 << period) - 1)
+            self._masks[period] = mask
+            return mask
+
+################################################################################
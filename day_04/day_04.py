@@ -1,8 +1,12 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from typing import List, Dict
-from re import compile
+from typing import Iterable, Iterator, Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
+from day_04.passport import Passport, get_mask
+from day_04.schema import Schema, any_of, number_range, one_of, pattern
 
 """
 --- Day 4: Passport Processing ---
@@ -22,51 +26,37 @@ solve both of these problems at the same time.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_04/input.txt"
 REQUIRED_KEYS = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid"]
 OPTIONAL_KEYS = ["cid"]
+REQUIRED_MASK = get_mask(REQUIRED_KEYS)
 
 VALIDATIONS = {
     # byr (Birth Year) - four digits; at least 1920 and at most 2002.
-    "byr":
-        lambda birth_year:
-        bool(compile("[0-9]{4}").fullmatch(birth_year)
-             and 1920 <= int(birth_year) <= 2002),
+    "byr": number_range(1920, 2002, digits=4),
     # iyr (Issue Year) - four digits; at least 2010 and at most 2020.
-    "iyr":
-        lambda issue_year:
-        bool(compile("[0-9]{4}").fullmatch(issue_year)
-             and 2010 <= int(issue_year) <= 2020),
+    "iyr": number_range(2010, 2020, digits=4),
     # eyr (Expiration Year) - four digits; at least 2020 and at most 2030.
-    "eyr":
-        lambda expiration_year:
-        bool(compile("[0-9]{4}").fullmatch(expiration_year)
-             and 2020 <= int(expiration_year) <= 2030),
+    "eyr": number_range(2020, 2030, digits=4),
     # hgt (Height) - a number followed by either cm or in:
     # If cm, the number must be at least 150 and at most 193.
     # If in, the number must be at least 59 and at most 76.
-    "hgt":
-        lambda height:
-        (bool(compile("[0-9]{3}cm").fullmatch(height))
-         and 150 <= int(height[:-2]) <= 193)
-        or (bool(compile("[0-9]{2}in").fullmatch(height))
-            and 59 <= int(height[:-2]) <= 76),
+    "hgt": any_of(number_range(150, 193, digits=3, suffix="cm"),
+                  number_range(59, 76, digits=2, suffix="in")),
     # hcl (Hair Color) - a # followed by exactly six characters 0-9 or a-f.
-    "hcl":
-        lambda hair_color:
-        bool(compile("#[0-9a-z]{6}").fullmatch(hair_color)),
+    "hcl": pattern("#[0-9a-z]{6}"),
     # ecl (Eye Color) - exactly one of: amb blu brn gry grn hzl oth.
-    "ecl":
-        lambda eye_color:
-        eye_color in ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"],
+    "ecl": one_of("amb", "blu", "brn", "gry", "grn", "hzl", "oth"),
     # pid (Passport ID) - a nine-digit number, including leading zeroes.
-    "pid":
-        lambda passport_id:
-        bool(compile("[0-9]{9}").fullmatch(passport_id))
+    "pid": pattern("[0-9]{9}")
 }
+# the rules compiled once, checked in the order of REQUIRED_KEYS
+SCHEMA = Schema({key: VALIDATIONS[key] for key in REQUIRED_KEYS})
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -123,14 +113,12 @@ def puzzle_1() -> None:
     The answer should be 222.
     """
 
-    passports = _create_passports("day_04/input.txt")
-    print(len([passport
-               for passport in passports
-               if all(key in passport for key in REQUIRED_KEYS)]))
+    return load_input(file_path, _get_valid_counts)[0]
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -212,43 +200,69 @@ def puzzle_2() -> None:
     The answer should be 140.
     """
 
-    passports = _create_passports("day_04/input.txt")
-    print(len([passport
-               for passport in passports
-               if _is_passport_valid(passport)]))
+    return load_input(file_path, _get_valid_counts)[1]
 
 ################################################################################
 
-def _create_passports(file_path: str) -> List[Dict[str, str]]:
+def _get_valid_counts(file_path: str) -> Tuple[int, int]:
     """
-    Creates passports list.
-
     :param file_path: file path with passports data
-    :return: passports list
+    :return: counts of the passports with all the required fields and of the
+    passports with all the required fields valid
     """
 
     with open(file_path, 'r') as f:
-        lines = f.readlines()
-        passports = []
-        passport = {}
-        passports.append(passport)
-
-        for line in lines:
-            if len(line) > 1:
-                for field in line.split(' '):
-                    segments = field.split(':')
-                    key = segments[0].strip()
-                    value = segments[1].strip()
-                    passport[key] = value
-            else:
-                passport = {}
-                passports.append(passport)
-
-        return passports
+        return count_valid(f)
+
+################################################################################
+
+def count_valid(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Counts the passports on the fly, one passport in memory at a time.
+
+    :param lines: lines of passports data
+    :return: counts of the passports with all the required fields and of the
+    passports with all the required fields valid
+    """
+
+    present_count = 0
+    valid_count = 0
+
+    for passport in iter_passports(lines):
+        if passport.has_fields(REQUIRED_MASK):
+            present_count += 1
+            if _is_passport_valid(passport):
+                valid_count += 1
+
+    return present_count, valid_count
+
+################################################################################
+
+def iter_passports(lines: Iterable[str]) -> Iterator[Passport]:
+    """
+    Parses the passports lazily, yielding each one as soon as its blank line
+    (or the end of the data) is read.
+
+    :param lines: lines of passports data
+    :return: passports
+    """
+
+    fields = []
+
+    for line in lines:
+        line_fields = line.split()
+        if line_fields:
+            fields.extend(line_fields)
+        elif fields:
+            yield Passport.from_fields(fields)
+            fields = []
+
+    if fields:
+        yield Passport.from_fields(fields)
 
 ################################################################################
 
-def _is_passport_valid(passport: Dict[str, str]) -> bool:
+def _is_passport_valid(passport: Passport) -> bool:
     """
     Determines whether the passport is valid or not.
 
@@ -256,10 +270,6 @@ def _is_passport_valid(passport: Dict[str, str]) -> bool:
     :return: True if the passport is valid, False otherwise
     """
 
-    try:
-        return all([VALIDATIONS[key](passport[key]) for key in REQUIRED_KEYS])
-    except KeyError:
-        # some of the required keys not found
-        return False
+    return SCHEMA.is_valid(passport)
 
 ################################################################################
@@ -0,0 +1,104 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from string import ascii_lowercase, digits
+from typing import Callable, Dict, Iterator
+
+from day_04.day_04 import REQUIRED_KEYS, OPTIONAL_KEYS
+
+"""
+Generator of passport batch files of any size. Fields are left out and given
+invalid values at random, so that all the validation rules get exercised.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 260
+PRESENCE_PROBABILITY = 0.9
+VALIDITY_PROBABILITY = 0.9
+FIELDS_PER_LINE_MAX = 4
+
+HEX_DIGITS = "0123456789abcdef"
+EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+VALID_VALUES: Dict[str, Callable[[Random], str]] = {
+    "byr": lambda random: str(random.randint(1920, 2002)),
+    "iyr": lambda random: str(random.randint(2010, 2020)),
+    "eyr": lambda random: str(random.randint(2020, 2030)),
+    "hgt": lambda random:
+    "{}cm".format(random.randint(150, 193))
+    if random.random() < 0.5
+    else "{}in".format(random.randint(59, 76)),
+    "hcl": lambda random:
+    '#' + ''.join(random.choice(HEX_DIGITS) for _ in range(6)),
+    "ecl": lambda random: random.choice(EYE_COLORS),
+    "pid": lambda random:
+    ''.join(random.choice(digits) for _ in range(9)),
+    "cid": lambda random: str(random.randint(100, 350))
+}
+
+INVALID_VALUES: Dict[str, Callable[[Random], str]] = {
+    "byr": lambda random: str(random.choice((
+        random.randint(1850, 1919), random.randint(2003, 2030)))),
+    "iyr": lambda random: str(random.choice((
+        random.randint(1990, 2009), random.randint(2021, 2040)))),
+    "eyr": lambda random: str(random.choice((
+        random.randint(2000, 2019), random.randint(2031, 2050)))),
+    "hgt": lambda random: random.choice((
+        "{}cm".format(random.randint(100, 149)),
+        "{}in".format(random.randint(77, 99)),
+        str(random.randint(59, 193)))),
+    "hcl": lambda random: random.choice((
+        ''.join(random.choice(HEX_DIGITS) for _ in range(6)),
+        '#' + ''.join(random.choice(HEX_DIGITS) for _ in range(5)))),
+    "ecl": lambda random: random.choice(("xry", "zzz", "blue", "gmt")),
+    "pid": lambda random:
+    ''.join(random.choice(digits) for _ in range(random.choice((8, 10)))),
+    "cid": lambda random: ''.join(random.choice(ascii_lowercase)
+                                  for _ in range(3))
+}
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the passport batch to
+    :param size: number of passports
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_passports(size, Random(seed)))
+
+################################################################################
+
+def _generate_passports(size: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of passports
+    :param random: random numbers generator
+    :return: passport records, separated by blank lines
+    """
+
+    for i in range(size):
+        fields = ["{}:{}".format(
+            key,
+            VALID_VALUES[key](random)
+            if random.random() < VALIDITY_PROBABILITY
+            else INVALID_VALUES[key](random))
+            for key in REQUIRED_KEYS + OPTIONAL_KEYS
+            if random.random() < PRESENCE_PROBABILITY]
+        if not fields:
+            # an empty record would look like two consecutive separators
+            fields = ["cid:{}".format(VALID_VALUES["cid"](random))]
+        random.shuffle(fields)
+
+        lines = []
+        while fields:
+            count = random.randint(1, FIELDS_PER_LINE_MAX)
+            lines.append(' '.join(fields[:count]))
+            fields = fields[count:]
+
+        yield ('' if i == 0 else '\n') + '\n'.join(lines) + '\n'
+
+################################################################################
@@ -0,0 +1,128 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Dict, Optional, Tuple
+
+from common.mmap_reader import NEWLINE, iter_lines, open_mapped, split_ranges
+from day_04.day_04 import INPUT_FILE_PATH, REQUIRED_MASK, SCHEMA, \
+    iter_passports
+
+"""
+Parallel mode of day 4 for huge passport batches. The file is split into byte
+ranges ending at blank lines, so no passport is split between two ranges, and
+every worker process maps the file and validates the passports of its range
+only. Besides the counts of the passports with all the required fields and of
+the valid passports, the workers count the passports failing each of the
+required fields (missing or invalid); the counts of the ranges are summed.
+
+Usage: python -m day_04.parallel [--workers 8] [FILE_PATH]
+"""
+
+################################################################################
+
+# ranges per worker, so that the workers finish at about the same time
+RANGES_PER_WORKER = 4
+CRLF = b"\r\n"
+
+################################################################################
+
+def validate_parallel(file_path: str = INPUT_FILE_PATH,
+                      workers: Optional[int] = None) \
+        -> Tuple[int, int, Dict[str, int]]:
+    """
+    :param file_path: file path with passports data
+    :param workers: number of worker processes, CPU count if None
+    :return: counts of the passports with all the required fields and of the
+    valid passports, and the number of passports failing each of the required
+    fields
+    """
+
+    workers = workers or cpu_count() or 1
+    ranges = split_ranges(file_path, workers * RANGES_PER_WORKER,
+                          _get_record_separator(file_path))
+
+    present_count = 0
+    valid_count = 0
+    failures = Counter({key: 0 for key in SCHEMA.fields})
+
+    with ProcessPoolExecutor(workers) as executor:
+        for range_counts in executor.map(
+                _validate_range,
+                [file_path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]):
+            present_count += range_counts[0]
+            valid_count += range_counts[1]
+            failures.update(range_counts[2])
+
+    return present_count, valid_count, dict(failures)
+
+################################################################################
+
+def _get_record_separator(file_path: str) -> bytes:
+    """
+    :param file_path: file path with passports data
+    :return: blank line separating the passports, with the line endings of
+    the file
+    """
+
+    with open_mapped(file_path) as mapped:
+        line_end = mapped.find(NEWLINE)
+        if line_end > 0 and mapped[line_end - 1:line_end + 1] == CRLF:
+            return CRLF * 2
+        return NEWLINE * 2
+
+################################################################################
+
+def _validate_range(file_path: str, start: int,
+                    end: int) -> Tuple[int, int, Dict[str, int]]:
+    """
+    :param file_path: file path with passports data
+    :param start: offset of the range, at the beginning of a passport or of a
+    blank line
+    :param end: offset after the range, after the end of a passport
+    :return: counts of the passports in the range with all the required
+    fields and of the valid ones, and the number of passports in the range
+    failing each of the required fields
+    """
+
+    present_count = 0
+    valid_count = 0
+    failures = Counter()
+
+    lines = (line.decode() for line in iter_lines(file_path, start, end))
+    for passport in iter_passports(lines):
+        if passport.has_fields(REQUIRED_MASK):
+            present_count += 1
+        failed = SCHEMA.failed_fields(passport)
+        if not failed:
+            valid_count += 1
+        failures.update(failed)
+
+    return present_count, valid_count, dict(failures)
+
+################################################################################
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Parallel day 4 passport checks.")
+    parser.add_argument(
+        "--workers", type=int,
+        help="number of worker processes; CPU count if omitted")
+    parser.add_argument(
+        "file_path", nargs='?', default=INPUT_FILE_PATH,
+        help="passports data file path; the bundled input.txt if omitted")
+    arguments = parser.parse_args()
+
+    present, valid, failed = validate_parallel(
+        arguments.file_path, arguments.workers)
+    print(present)
+    print(valid)
+    for field, count in failed.items():
+        print("{}: {}".format(field, count))
+    exit(0)
+
+################################################################################
@@ -0,0 +1,146 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+"""
+Compact passport record for keeping many passports around. The values are a
+tuple with a slot for each of the known FIELDS (None where the field is
+missing) and the present fields are the bits of an integer mask, so checking
+the presence of a set of fields is one AND and one comparison with its mask.
+With __slots__, a record is an object, a tuple and an int instead of a dict.
+The record is a read-only mapping of the present fields; fields other than
+FIELDS are dropped.
+"""
+
+################################################################################
+
+FIELDS = ("byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid")
+FIELD_INDICES: Dict[str, int] = {
+    field: index for index, field in enumerate(FIELDS)}
+
+################################################################################
+
+def get_mask(fields: Iterable[str]) -> int:
+    """
+    :param fields: fields, all of them from FIELDS
+    :return: mask with the bits of the fields set
+    """
+
+    mask = 0
+    for field in fields:
+        mask |= 1 << FIELD_INDICES[field]
+    return mask
+
+################################################################################
+
+class Passport(Mapping):
+    __slots__ = ("_values", "_mask")
+
+################################################################################
+
+    def __init__(self, values: Sequence[Optional[str]], mask: int):
+        """
+        :param values: value of each of the FIELDS, None if missing
+        :param mask: mask of the present fields, matching the values
+        """
+
+        self._values = tuple(values)
+        self._mask = mask
+
+################################################################################
+
+    @classmethod
+    def from_fields(cls, fields: Iterable[str]) -> "Passport":
+        """
+        :param fields: "key:value" fields
+        :return: passport with the fields
+        """
+
+        values = [None] * len(FIELDS)
+        mask = 0
+        for field in fields:
+            segments = field.split(':')
+            index = FIELD_INDICES.get(segments[0])
+            if index is not None:
+                values[index] = segments[1]
+                mask |= 1 << index
+        return cls(values, mask)
+
+################################################################################
+
+    @property
+    def mask(self) -> int:
+        """
+        :return: mask of the present fields
+        """
+
+        return self._mask
+
+################################################################################
+
+    def has_fields(self, mask: int) -> bool:
+        """
+        :param mask: mask of the fields, see get_mask
+        :return: True if all the fields are present, False otherwise
+        """
+
+        return self._mask & mask == mask
+
+################################################################################
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        :param key: field
+        :param default: value returned if the field is missing
+        :return: value of the field, the default if missing
+        """
+
+        index = FIELD_INDICES.get(key)
+        if index is None or self._values[index] is None:
+            return default
+        return self._values[index]
+
+################################################################################
+
+    def __getitem__(self, key: str) -> str:
+        """
+        :param key: field
+        :return: value of the field; KeyError if missing
+        """
+
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+################################################################################
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        :return: present fields
+        """
+
+        return (field for field, value in zip(FIELDS, self._values)
+                if value is not None)
+
+################################################################################
+
+    def __len__(self) -> int:
+        """
+        :return: number of present fields
+        """
+
+        return self._mask.bit_count()
+
+################################################################################
+
+    def __repr__(self) -> str:
+        """
+        :return: passport with its present fields
+        """
+
+        return "Passport({})".format(dict(self))
+
+################################################################################
@@ -0,0 +1,131 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from re import compile
+from typing import Callable, Iterable, List, Mapping
+
+"""
+Schema-driven record validator. Field rules are built once by the factories
+below (number ranges checked without regular expressions, patterns compiled
+once, choices as a set) and a schema checks the rules of a record one by
+one, stopping at the first missing or invalid field.
+"""
+
+################################################################################
+
+Rule = Callable[[str], bool]
+
+################################################################################
+
+def number_range(minimum: int, maximum: int, digits: int = None,
+                 suffix: str = '') -> Rule:
+    """
+    :param minimum: smallest valid number
+    :param maximum: biggest valid number
+    :param digits: exact number of digits, any if None
+    :param suffix: text required after the number (a unit etc.)
+    :return: rule accepting decimal numbers in the range, followed by the
+    suffix
+    """
+
+    def rule(value: str) -> bool:
+        if not value.endswith(suffix):
+            return False
+        number = value[:len(value) - len(suffix)]
+        if digits is not None and len(number) != digits:
+            return False
+        # isdigit alone accepts non-ASCII digits as well
+        return number.isascii() and number.isdigit() \
+            and minimum <= int(number) <= maximum
+
+    return rule
+
+################################################################################
+
+def pattern(regular_expression: str) -> Rule:
+    """
+    :param regular_expression: regular expression the whole value must match
+    :return: rule accepting the matching values
+    """
+
+    full_match = compile(regular_expression).fullmatch
+    return lambda value: full_match(value) is not None
+
+################################################################################
+
+def one_of(*choices: str) -> Rule:
+    """
+    :param choices: valid values
+    :return: rule accepting only the choices
+    """
+
+    return frozenset(choices).__contains__
+
+################################################################################
+
+def any_of(*rules: Rule) -> Rule:
+    """
+    :param rules: rules
+    :return: rule accepting the values accepted by any of the rules
+    """
+
+    return lambda value: any(rule(value) for rule in rules)
+
+################################################################################
+
+class Schema(object):
+
+    def __init__(self, rules: Mapping[str, Rule]):
+        """
+        :param rules: rules of the required fields; fields without a rule are
+        optional and never checked
+        """
+
+        self._rules = tuple(rules.items())
+
+################################################################################
+
+    @property
+    def fields(self) -> Iterable[str]:
+        """
+        :return: required fields, in the order they are checked
+        """
+
+        return tuple(key for key, _ in self._rules)
+
+################################################################################
+
+    def is_valid(self, record: Mapping[str, str]) -> bool:
+        """
+        :param record: field values
+        :return: True if all the required fields are present and valid, False
+        otherwise
+        """
+
+        for key, rule in self._rules:
+            value = record.get(key)
+            if value is None or not rule(value):
+                return False
+
+        return True
+
+################################################################################
+
+    def failed_fields(self, record: Mapping[str, str]) -> List[str]:
+        """
+        Checks all the rules, without stopping at the first failure.
+
+        :param record: field values
+        :return: required fields missing or invalid in the record, in the
+        order they are checked
+        """
+
+        failed = []
+        for key, rule in self._rules:
+            value = record.get(key)
+            if value is None or not rule(value):
+                failed.append(key)
+
+        return failed
+
+################################################################################
@@ -3,6 +3,10 @@ __email__ = "tofugangsw@gmail.com"
 
 from typing import Tuple
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
+
 """
 --- Day 5: Binary Boarding ---
 
@@ -17,6 +21,7 @@ process of elimination.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_05/input.txt"
 ROW_RANGE = range(128)
 COLUMN_RANGE = range(8)
 
@@ -29,7 +34,8 @@ PARTITIONING = {
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -83,15 +89,14 @@ def puzzle_1() -> None:
     The answer should be 864.
     """
 
-    with open("day_05/input.txt", 'r') as f:
-        seats = [_get_boarding_pass_seat(boarding_pass)
-                 for boarding_pass in f.readlines()]
-        seat_ids = [_get_seat_id(seat) for seat in seats]
-        print(max(seat_ids))
+    seats = load_input(file_path, _get_seats)
+    seat_ids = [_get_seat_id(seat) for seat in seats]
+    return max(seat_ids)
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -110,16 +115,25 @@ def puzzle_2() -> None:
     The answer should be 739.
     """
 
-    with open("day_05/input.txt", 'r') as f:
-        seats = [_get_boarding_pass_seat(boarding_pass)
-                 for boarding_pass in f.readlines()]
-        seat_ids = [_get_seat_id(seat) for seat in seats]
-        print([_get_seat_id((row, column))
-               for row in ROW_RANGE
-               for column in COLUMN_RANGE
-               if (row, column) not in seats
-               and _get_seat_id((row, column)) + 1 in seat_ids
-               and _get_seat_id((row, column)) - 1 in seat_ids][0])
+    seats = load_input(file_path, _get_seats)
+    seat_ids = [_get_seat_id(seat) for seat in seats]
+    return [_get_seat_id((row, column))
+            for row in ROW_RANGE
+            for column in COLUMN_RANGE
+            if (row, column) not in seats
+            and _get_seat_id((row, column)) + 1 in seat_ids
+            and _get_seat_id((row, column)) - 1 in seat_ids][0]
+
+################################################################################
+
+def _get_seats(file_path: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    :param file_path: file path with the boarding passes
+    :return: (row, column) seats of the boarding passes
+    """
+
+    return tuple(_get_boarding_pass_seat(boarding_pass.decode())
+                 for boarding_pass in iter_lines(file_path))
 
 ################################################################################
 
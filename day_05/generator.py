@@ -0,0 +1,73 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import List
+
+from day_05.day_05 import ROW_RANGE, COLUMN_RANGE
+
+"""
+Generator of boarding pass lists of any size. The passes cover a contiguous
+block of seats with exactly one seat missing in the middle of it. There are
+only 1024 seats on the plane, so bigger lists repeat some of the passes.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 789
+# keep the first and the last row of the plane empty, one more seat is mine
+MAX_SEATS = (len(ROW_RANGE) - 2) * len(COLUMN_RANGE) - 1
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the boarding passes to
+    :param size: number of boarding passes, at least 2
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines("{}\n".format(boarding_pass)
+                     for boarding_pass in _generate_boarding_passes(
+                         size, Random(seed)))
+
+################################################################################
+
+def _generate_boarding_passes(size: int, random: Random) -> List[str]:
+    """
+    :param size: number of boarding passes, at least 2
+    :param random: random numbers generator
+    :return: boarding passes
+    """
+
+    if size < 2:
+        raise ValueError("At least 2 boarding passes are needed.")
+
+    seats_count = min(size, MAX_SEATS) + 1
+    first_seat_id = random.randint(
+        len(COLUMN_RANGE),
+        len(COLUMN_RANGE) * (len(ROW_RANGE) - 1) - seats_count)
+    seat_ids = list(range(first_seat_id, first_seat_id + seats_count))
+    # my seat
+    seat_ids.pop(random.randint(1, seats_count - 2))
+    seat_ids += [random.choice(seat_ids)
+                 for _ in range(size - len(seat_ids))]
+    random.shuffle(seat_ids)
+
+    return [_get_boarding_pass(seat_id) for seat_id in seat_ids]
+
+################################################################################
+
+def _get_boarding_pass(seat_id: int) -> str:
+    """
+    :param seat_id: seat ID
+    :return: boarding pass of the seat
+    """
+
+    row = format(seat_id // len(COLUMN_RANGE), "07b")
+    column = format(seat_id % len(COLUMN_RANGE), "03b")
+    return row.replace('0', 'F').replace('1', 'B') \
+        + column.replace('0', 'L').replace('1', 'R')
+
+################################################################################
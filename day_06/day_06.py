@@ -2,6 +2,10 @@ __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
 from string import ascii_lowercase
+from typing import Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
 
 """
 --- Day 6: Custom Customs ---
@@ -12,7 +16,12 @@ larger plane, customs declaration forms are distributed to the passengers.
 
 ################################################################################
 
-def puzzle_1() -> None:
+INPUT_FILE_PATH = "day_06/input.txt"
+
+################################################################################
+
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -73,13 +82,13 @@ def puzzle_1() -> None:
     The answer should be 6170.
     """
 
-    with open("day_06/input.txt", 'r') as f:
-        print(sum([len(set(group.strip().replace('\n', '')))
-                   for group in f.read().split("\n\n")]))
+    return sum([len(set(''.join(group)))
+                for group in load_input(file_path, _get_groups)])
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -126,11 +135,21 @@ def puzzle_2() -> None:
     The answer should be 2947.
     """
 
-    with open("day_06/input.txt", 'r') as f:
-        print(len([question
-                   for group in f.read().split("\n\n")
-                   for question in ascii_lowercase
-                   if all([question in person
-                           for person in group.strip().split('\n')])]))
+    return len([question
+                for group in load_input(file_path, _get_groups)
+                for question in ascii_lowercase
+                if all([question in person for person in group])])
+
+################################################################################
+
+def _get_groups(file_path: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    :param file_path: file path with the answers
+    :return: groups, each with the answers of its people
+    """
+
+    with open(file_path, 'r') as f:
+        return tuple(tuple(group.strip().split('\n'))
+                     for group in f.read().split("\n\n"))
 
 ################################################################################
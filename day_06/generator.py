@@ -0,0 +1,49 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from string import ascii_lowercase
+from typing import Iterator
+
+"""
+Generator of customs declaration forms of any size.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 461
+GROUP_SIZE_MAX = 5
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the answers to
+    :param size: number of groups
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_groups(size, Random(seed)))
+
+################################################################################
+
+def _generate_groups(size: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of groups
+    :param random: random numbers generator
+    :return: groups answers, separated by blank lines
+    """
+
+    for i in range(size):
+        # questions answered by everyone in the group
+        common = random.sample(ascii_lowercase, random.randint(0, 5))
+        people = [''.join(common + random.sample(
+            ascii_lowercase, random.randint(1, 10)))
+            for _ in range(random.randint(1, GROUP_SIZE_MAX))]
+        # every person answers each question at most once
+        people = [''.join(sorted(set(person), key=person.index))
+                  for person in people]
+        yield ('' if i == 0 else '\n') + '\n'.join(people) + '\n'
+
+################################################################################
@@ -4,6 +4,9 @@ __email__ = "tofugangsw@gmail.com"
 from re import finditer
 from typing import Dict, List, Union, Set
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+
 """
 --- Day 7: Handy Haversacks ---
 
@@ -14,6 +17,7 @@ due to issues in luggage processing.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_07/input.txt"
 SEPARATOR = "bags contain"
 MY_BAG = "shiny gold"
 
@@ -22,7 +26,8 @@ KEY_BAGS_COUNT = "BAGS_COUNT"
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -72,12 +77,13 @@ def puzzle_1() -> None:
     The answer should be 226.
     """
 
-    bags_rules = _get_bags_rules()
-    print(len(_get_possible_bag_containers(MY_BAG, bags_rules)))
+    bags_rules = load_input(file_path, _get_bags_rules)
+    return len(_get_possible_bag_containers(MY_BAG, bags_rules))
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
     It's getting pretty expensive to fly these days - not because of ticket
@@ -117,12 +123,13 @@ def puzzle_2() -> None:
     The answer should be 9569.
     """
 
-    bags_rules = _get_bags_rules()
-    print(_get_required_count(MY_BAG, bags_rules))
+    bags_rules = load_input(file_path, _get_bags_rules)
+    return _get_required_count(MY_BAG, bags_rules)
 
 ################################################################################
 
-def _get_bags_rules() -> Dict[str, List[Dict[str, Union[int, str]]]]:
+def _get_bags_rules(
+        file_path: str) -> Dict[str, List[Dict[str, Union[int, str]]]]:
     """
     Load bag contents rules into a dict structure like so:
     bag_container [{
@@ -130,10 +137,11 @@ def _get_bags_rules() -> Dict[str, List[Dict[str, Union[int, str]]]]:
         count
     },...]
 
+    :param file_path: file path with bag contents rules
     :return: bag contents rules
     """
 
-    with open("day_07/input.txt", 'r') as f:
+    with open(file_path, 'r') as f:
         bags = {}
         for line in [line.strip() for line in f.readlines()]:
             bag_container = line.split(SEPARATOR)[0].strip()
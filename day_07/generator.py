@@ -0,0 +1,113 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator, List
+
+from day_07.day_07 import MY_BAG
+
+"""
+Generator of bag rules of any size. The bags are split into levels and every
+bag contains only bags from the next level, so the rules never contain a cycle
+and the depth of the graph does not depend on its size. My bag is placed in
+the middle level, so that it has both many containers and many contents.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 594
+DEPTH = 10
+CONTENTS_MAX = 4
+COUNT_MAX = 5
+
+COLORS = ["red", "orange", "yellow", "green", "cyan", "teal", "indigo",
+          "violet", "purple", "magenta", "white", "gray", "tan", "maroon",
+          "olive", "salmon", "coral", "crimson", "plum", "lime", "silver",
+          "gold", "chartreuse", "fuchsia", "lavender", "aqua", "tomato"]
+# adjective letters, no 'b' so that adjectives can never contain "bag"
+LETTERS = "acdefghijklmnopqrstuvwxyz"
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0,
+             depth: int = DEPTH) -> None:
+    """
+    :param file_path: file path to write the bag rules to
+    :param size: number of rules, at least 2 * depth
+    :param seed: random seed
+    :param depth: number of bag levels
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_rules(size, depth, Random(seed)))
+
+################################################################################
+
+def _generate_rules(size: int, depth: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of rules, at least 2 * depth
+    :param depth: number of bag levels
+    :param random: random numbers generator
+    :return: bag rules lines
+    """
+
+    if size < 2 * depth:
+        raise ValueError("At least {} bag rules are needed.".format(2 * depth))
+
+    bags = _get_color_codes(size - 1, random)
+    levels = [bags[level * (size - 1) // depth:
+                   (level + 1) * (size - 1) // depth]
+              for level in range(depth)]
+    levels[depth // 2].append(MY_BAG)
+
+    rules = []
+    for level in range(depth):
+        for bag in levels[level]:
+            contents = random.sample(
+                levels[level + 1],
+                min(random.randint(1, CONTENTS_MAX), len(levels[level + 1]))) \
+                if level + 1 < depth \
+                else []
+            if contents:
+                rules.append("{} bags contain {}.\n".format(bag, ', '.join(
+                    "{} {} {}".format(
+                        count, content, "bag" if count == 1 else "bags")
+                    for content, count in (
+                        (content, random.randint(1, COUNT_MAX))
+                        for content in contents))))
+            else:
+                rules.append("{} bags contain no other bags.\n".format(bag))
+
+    random.shuffle(rules)
+    return iter(rules)
+
+################################################################################
+
+def _get_color_codes(count: int, random: Random) -> List[str]:
+    """
+    :param count: number of color codes
+    :param random: random numbers generator
+    :return: unique color codes in random order, my bag not among them
+    """
+
+    color_codes = []
+    i = 0
+    while len(color_codes) < count:
+        # adjectives are the numbers 0, 1, 2... written with the letters
+        adjective = ''
+        number = i // len(COLORS)
+        while True:
+            adjective = LETTERS[number % len(LETTERS)] + adjective
+            number //= len(LETTERS)
+            if number == 0:
+                break
+        color_code = "{}{} {}".format(
+            LETTERS[i % len(LETTERS)], adjective, COLORS[i % len(COLORS)])
+        if color_code != MY_BAG:
+            color_codes.append(color_code)
+        i += 1
+
+    random.shuffle(color_codes)
+    return color_codes
+
+################################################################################
@@ -3,6 +3,10 @@ __email__ = "tofugangsw@gmail.com"
 
 from typing import List, Dict, Union, Tuple
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
+
 """
 --- Day 8: Handheld Halting ---
 
@@ -15,6 +19,7 @@ Their handheld game console won't turn on! They ask if you can take a look.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_08/input.txt"
 KEY_OPERATION = "OPERATION"
 KEY_ARGUMENT = "ARGUMENT"
 KEY_MODIFIED = "MODIFIED"
@@ -25,7 +30,8 @@ NOP_OPERATION = "nop"
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -92,14 +98,15 @@ def puzzle_1() -> None:
     The answer should be 1801.
     """
 
-    program = _load_program()
+    program = load_input(file_path, _load_program)
     result = _run_program(program)
     accumulator = result[0]
-    print(accumulator)
+    return accumulator
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -156,7 +163,9 @@ def puzzle_2() -> None:
     The answer should be 2060.
     """
 
-    program = _load_program()
+    # the program gets modified, work on a copy of the shared one
+    program = [dict(instruction)
+               for instruction in load_input(file_path, _load_program)]
 
     while True:
         result = _run_program(program)
@@ -165,22 +174,21 @@ def puzzle_2() -> None:
             _modify_program(program)
         else:
             # program terminated normally
-            print(result[0])
-            break
+            return result[0]
 
 ################################################################################
 
-def _load_program() -> List[Dict[str, Union[str, int, bool]]]:
+def _load_program(file_path: str) -> List[Dict[str, Union[str, int, bool]]]:
     """
+    :param file_path: file path with the boot code
     :return: list of instructions
     """
 
-    with open("day_08/input.txt", 'r') as f:
-        return [{
-            KEY_OPERATION: line.split(' ')[0].strip(),
-            KEY_ARGUMENT: int(line.split(' ')[1].strip()),
-            KEY_MODIFIED: False
-        } for line in [line.strip() for line in f.readlines()]]
+    return [{
+        KEY_OPERATION: line.split(' ')[0].strip(),
+        KEY_ARGUMENT: int(line.split(' ')[1].strip()),
+        KEY_MODIFIED: False
+    } for line in (line.decode().strip() for line in iter_lines(file_path))]
 
 ################################################################################
 
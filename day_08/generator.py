@@ -0,0 +1,117 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import List
+
+from day_08.day_08 import \
+    MODIFY_ACCUMULATOR_OPERATION, JUMP_OPERATION, NOP_OPERATION
+
+"""
+Generator of boot codes of any size with exactly one corrupted instruction.
+
+The program is made of a path running from the first instruction to the
+corrupted one and a tail running from there to the end. The corrupted
+instruction is a jump back into the path, so the program loops. Changing it to
+a nop lets the program run through the tail and terminate. Changing any other
+instruction keeps the loop:
+- nops on the path jump to the path (or to themselves) when changed to jumps,
+- every jump on the path skipping some instructions is followed by a jump back
+  to it, which is reached when the jump is changed to a nop,
+- instructions off the path are never reached.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 623
+ARGUMENT_MAX = 50
+JUMP_MAX = 10
+# part of the program before the corrupted instruction
+PATH_LENGTH_RATIO = 0.9
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the boot code to
+    :param size: number of instructions, at least 3
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines("{} {:+d}\n".format(operation, argument)
+                     for operation, argument in _generate_program(
+                         size, Random(seed)))
+
+################################################################################
+
+def _generate_program(size: int, random: Random) -> List[List]:
+    """
+    :param size: number of instructions, at least 3
+    :param random: random numbers generator
+    :return: list of [operation, argument] instructions
+    """
+
+    if size < 3:
+        raise ValueError("The boot code needs at least 3 instructions.")
+
+    corrupted = min(max(int(size * PATH_LENGTH_RATIO), 1), size - 1)
+    program = [_get_filler_instruction(random) for _ in range(size)]
+
+    # the path
+    path = []
+    i = 0
+    while i < corrupted:
+        path.append(i)
+        choice = random.random()
+        if choice < 0.4:
+            program[i] = [MODIFY_ACCUMULATOR_OPERATION, _get_argument(random)]
+            i += 1
+        elif choice < 0.6:
+            program[i] = [NOP_OPERATION, random.choice(path) - i]
+            i += 1
+        else:
+            jump = random.randint(1, min(JUMP_MAX, corrupted - i))
+            program[i] = [JUMP_OPERATION, jump]
+            if jump > 1:
+                program[i + 1] = [JUMP_OPERATION, -1]
+            i += jump
+
+    program[corrupted] = [JUMP_OPERATION, random.choice(path) - corrupted]
+
+    # the tail
+    i = corrupted + 1
+    while i < size:
+        if random.random() < 0.5:
+            program[i] = [MODIFY_ACCUMULATOR_OPERATION, _get_argument(random)]
+            i += 1
+        else:
+            jump = random.randint(1, min(JUMP_MAX, size - i))
+            program[i] = [JUMP_OPERATION, jump]
+            i += jump
+
+    return program
+
+################################################################################
+
+def _get_filler_instruction(random: Random) -> List:
+    """
+    :param random: random numbers generator
+    :return: random instruction for a place that is never reached
+    """
+
+    return [random.choice((MODIFY_ACCUMULATOR_OPERATION, JUMP_OPERATION,
+                           NOP_OPERATION)),
+            _get_argument(random)]
+
+################################################################################
+
+def _get_argument(random: Random) -> int:
+    """
+    :param random: random numbers generator
+    :return: random non zero argument
+    """
+
+    return random.choice((-1, 1)) * random.randint(1, ARGUMENT_MAX)
+
+################################################################################
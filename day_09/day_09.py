@@ -2,7 +2,11 @@ __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
 from itertools import combinations
-from typing import List
+from typing import Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
 
 """
 --- Day 9: Encoding Error ---
@@ -20,11 +24,13 @@ The data appears to be encrypted with the eXchange-Masking Addition System
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_09/input.txt"
 PREAMBLE_LENGTH = 25
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -91,13 +97,14 @@ def puzzle_1() -> None:
     The answer should be 1124361034.
     """
 
-    numbers = _get_numbers()
+    numbers = load_input(file_path, _get_numbers)
     invalid_number = _get_invalid_number(numbers)
-    print(invalid_number)
+    return invalid_number
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -141,24 +148,24 @@ def puzzle_2() -> None:
     The answer should be 129444555.
     """
 
-    numbers = _get_numbers()
+    numbers = load_input(file_path, _get_numbers)
     invalid_number = _get_invalid_number(numbers)
     encryption_weakness = _get_encryption_weakness(numbers, invalid_number)
-    print(encryption_weakness)
+    return encryption_weakness
 
 ################################################################################
 
-def _get_numbers() -> List[int]:
+def _get_numbers(file_path: str) -> Tuple[int, ...]:
     """
     List of numbers from the puzzle input.
     """
 
-    with open("day_09/input.txt", 'r') as f:
-        return [int(line.strip()) for line in f.readlines()]
+    return tuple(int(line) for line in iter_lines(file_path))
 
 ################################################################################
 
-def _get_invalid_number(numbers: List[int]) -> int:
+@timed()
+def _get_invalid_number(numbers: Tuple[int, ...]) -> int:
     """
     :param numbers: list of numbers from the puzzle input
     :return: the first number which is not the sum of any two 25 preceding
@@ -173,7 +180,9 @@ def _get_invalid_number(numbers: List[int]) -> int:
 
 ################################################################################
 
-def _get_encryption_weakness(numbers: List[int], invalid_number: int) -> int:
+@timed()
+def _get_encryption_weakness(numbers: Tuple[int, ...],
+                             invalid_number: int) -> int:
     """
     :param numbers: list of numbers from the puzzle input
     :param invalid_number: the first number which is not the sum of any two 25
@@ -0,0 +1,98 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from itertools import accumulate, combinations
+from random import Random
+from typing import List
+
+from day_09.day_09 import PREAMBLE_LENGTH
+
+"""
+Generator of XMAS data of any size.
+
+Every valid number is a sum of two of the previous ones, so the valid numbers
+at least double every preamble length. To keep the numbers reasonably small,
+only the first VALID_LENGTH_MAX numbers follow the rule; then comes the
+invalid number, and the rest is random filler. The invalid number is the sum
+of a contiguous run of the valid numbers, the first such run in the data.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 1000
+VALID_LENGTH_MAX = 1000
+PREAMBLE_NUMBER_MAX = 50
+RUN_LENGTH_MAX = 17
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the numbers to
+    :param size: count of numbers, more than the preamble length
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines("{}\n".format(number)
+                     for number in _generate_numbers(size, Random(seed)))
+
+################################################################################
+
+def _generate_numbers(size: int, random: Random) -> List[int]:
+    """
+    :param size: count of numbers, more than the preamble length
+    :param random: random numbers generator
+    :return: XMAS data
+    """
+
+    if size <= PREAMBLE_LENGTH + 2:
+        raise ValueError("More than {} numbers are needed.".format(
+            PREAMBLE_LENGTH + 2))
+
+    while True:
+        numbers = random.sample(
+            range(1, PREAMBLE_NUMBER_MAX + 1), PREAMBLE_LENGTH)
+        while len(numbers) < min(size - 1, VALID_LENGTH_MAX):
+            numbers.append(sum(random.sample(numbers[-PREAMBLE_LENGTH:], 2)))
+
+        invalid_number = _get_invalid_number(numbers, random)
+        if invalid_number is not None:
+            break
+
+    filler_max = max(numbers[-PREAMBLE_LENGTH:])
+    return numbers + [invalid_number] + [
+        random.randint(1, filler_max)
+        for _ in range(size - len(numbers) - 1)]
+
+################################################################################
+
+def _get_invalid_number(numbers: List[int], random: Random) -> int:
+    """
+    :param numbers: valid numbers
+    :param random: random numbers generator
+    :return: sum of a random contiguous run of the numbers that is no sum of
+    any two of the last preamble numbers and that no other run sums to; None
+    if no such run was found
+    """
+
+    sums = set(sum(combination) for combination in combinations(
+        numbers[-PREAMBLE_LENGTH:], 2))
+    prefix_sums = [0] + list(accumulate(numbers))
+    prefix_sums_indexes = {
+        prefix_sum: i for i, prefix_sum in enumerate(prefix_sums)}
+
+    for _ in range(100):
+        run_length = random.randint(2, min(RUN_LENGTH_MAX, len(numbers)))
+        start = random.randint(0, len(numbers) - run_length)
+        invalid_number = prefix_sums[start + run_length] - prefix_sums[start]
+        # all the numbers are positive, so there is at most one run starting
+        # at each index
+        if invalid_number not in sums and not any(
+                prefix_sums_indexes.get(prefix_sums[i] + invalid_number)
+                for i in range(start)):
+            return invalid_number
+
+    return None
+
+################################################################################
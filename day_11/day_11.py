@@ -1,6 +1,7 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
+from common.instrumentation import timed
 from day_11.seat_layout import SeatLayout
 
 """
@@ -18,7 +19,12 @@ a quick map of the seat layout (your puzzle input).
 
 ################################################################################
 
-def puzzle_1() -> None:
+INPUT_FILE_PATH = "day_11/input.txt"
+
+################################################################################
+
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -125,14 +131,15 @@ def puzzle_1() -> None:
     The answer should be 2273.
     """
 
-    layout = SeatLayout()
+    layout = SeatLayout(file_path)
     while not layout.is_stable():
         layout.change_layout_1()
-    print(layout.occupied_seats_count())
+    return layout.occupied_seats_count()
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -266,9 +273,9 @@ def puzzle_2() -> None:
     The answer should be 2064.
     """
 
-    layout = SeatLayout()
+    layout = SeatLayout(file_path)
     while not layout.is_stable():
         layout.change_layout_2()
-    print(layout.occupied_seats_count())
+    return layout.occupied_seats_count()
 
 ################################################################################
@@ -0,0 +1,128 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator, List
+
+from day_11.seat_layout import SeatLayout
+
+"""
+Generator of seat layouts of any height.
+
+Random layouts do not always settle; big areas of seats can keep filling up
+and emptying forever. The layouts are therefore made of bands of seats
+separated by rows of floor. Under the first set of rules the bands change
+independently of each other, and only bands that settle are used, picked from
+a small pool of them.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 97
+WIDTH = 91
+BAND_HEIGHT = 8
+BANDS_POOL_SIZE = 16
+FLOOR_PROBABILITY = 0.15
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0,
+             width: int = WIDTH) -> None:
+    """
+    :param file_path: file path to write the seat layout to
+    :param size: number of rows
+    :param seed: random seed
+    :param width: number of columns
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_rows(size, width, Random(seed)))
+
+################################################################################
+
+def _generate_rows(size: int, width: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of rows
+    :param width: number of columns
+    :param random: random numbers generator
+    :return: seat layout rows with empty seats and floor
+    """
+
+    bands = [_generate_settling_band(BAND_HEIGHT, width, random)
+             for _ in range(BANDS_POOL_SIZE)]
+    separator = SeatLayout.FLOOR * width
+
+    for _ in range(size // (BAND_HEIGHT + 1)):
+        for row in random.choice(bands) + [separator]:
+            yield row + '\n'
+
+    if size % (BAND_HEIGHT + 1) > 0:
+        for row in _generate_settling_band(
+                size % (BAND_HEIGHT + 1), width, random):
+            yield row + '\n'
+
+################################################################################
+
+def _generate_settling_band(height: int, width: int,
+                            random: Random) -> List[str]:
+    """
+    :param height: number of rows
+    :param width: number of columns
+    :param random: random numbers generator
+    :return: band of random rows that settles
+    """
+
+    while True:
+        band = [''.join(SeatLayout.FLOOR
+                        if random.random() < FLOOR_PROBABILITY
+                        else SeatLayout.SEAT_EMPTY
+                        for _ in range(width))
+                for _ in range(height)]
+        if _settles(band):
+            return band
+
+################################################################################
+
+def _settles(band: List[str]) -> bool:
+    """
+    Applies the first set of rules to the band, surrounded by floor, until it
+    either settles or repeats a previous state.
+
+    :param band: band of rows
+    :return: True if the band settles, False otherwise
+    """
+
+    height = len(band)
+    width = len(band[0])
+    seats = [(i, j)
+             for i in range(height)
+             for j in range(width)
+             if band[i][j] != SeatLayout.FLOOR]
+    seats_set = set(seats)
+    neighbours = {
+        (i, j): [(i + di, j + dj)
+                 for di in (-1, 0, 1)
+                 for dj in (-1, 0, 1)
+                 if (di, dj) != (0, 0) and (i + di, j + dj) in seats_set]
+        for (i, j) in seats}
+
+    occupied = frozenset()
+    states = set()
+    while occupied not in states:
+        states.add(occupied)
+        new_occupied = frozenset(
+            seat
+            for seat in seats
+            if (seat not in occupied
+                and not any(neighbour in occupied
+                            for neighbour in neighbours[seat]))
+            or (seat in occupied
+                and sum(neighbour in occupied
+                        for neighbour in neighbours[seat]) < 4))
+        if new_occupied == occupied:
+            return True
+        occupied = new_occupied
+
+    return False
+
+################################################################################
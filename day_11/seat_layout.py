@@ -1,6 +1,10 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
+from typing import Tuple
+
+from common.input_loader import load_input
+
 ################################################################################
 
 class SeatLayout(object):
@@ -57,10 +61,23 @@ class SeatLayout(object):
 
 ################################################################################
 
-    def __init__(self):
-        with open("day_11/input.txt", 'r') as f:
-            self._seat_layout = [line.strip() for line in f.readlines()]
-            self._is_stable = False
+    def __init__(self, file_path: str):
+        # the layout is only ever replaced, never modified in place, so the
+        # shared parsed input can be used directly
+        self._seat_layout = load_input(file_path, self._load_seat_layout)
+        self._is_stable = False
+
+################################################################################
+
+    @staticmethod
+    def _load_seat_layout(file_path: str) -> Tuple[str, ...]:
+        """
+        :param file_path: file path with the seat layout
+        :return: seat layout rows
+        """
+
+        with open(file_path, 'r') as f:
+            return tuple(line.strip() for line in f.readlines())
 
 ################################################################################
 
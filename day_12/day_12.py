@@ -1,8 +1,11 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from numpy import linalg, dot, arccos, round
-from math import degrees, radians, sin, cos
+from typing import Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
 
 """
 --- Day 12: Rain Risk ---
@@ -18,6 +21,7 @@ quickly volunteer.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_12/input.txt"
 NORTH = 'N'
 SOUTH = 'S'
 EAST = 'E'
@@ -28,7 +32,8 @@ FORWARD = 'F'
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -79,45 +84,42 @@ def puzzle_1() -> None:
     The answer should be 1186.
     """
 
-    with open("day_12/input.txt", 'r') as f:
-        instructions = [line.strip() for line in f.readlines()]
-        pos_x = 0
-        pos_y = 0
-        direction = 0
-
-        for instruction in instructions:
-            action = instruction[0]
-            value = int(instruction[1:])
-
-            if action == NORTH:
-                pos_y += value
-            elif action == SOUTH:
-                pos_y -= value
-            elif action == EAST:
+    instructions = load_input(file_path, _get_instructions)
+    pos_x = 0
+    pos_y = 0
+    direction = 0
+
+    for action, value in instructions:
+        if action == NORTH:
+            pos_y += value
+        elif action == SOUTH:
+            pos_y -= value
+        elif action == EAST:
+            pos_x += value
+        elif action == WEST:
+            pos_x -= value
+        elif action == LEFT:
+            direction -= value
+            direction %= 360
+        elif action == RIGHT:
+            direction += value
+            direction %= 360
+        elif action == FORWARD:
+            if direction == 0:
                 pos_x += value
-            elif action == WEST:
+            elif direction == 90:
+                pos_y -= value
+            elif direction == 180:
                 pos_x -= value
-            elif action == LEFT:
-                direction -= value
-                direction %= 360
-            elif action == RIGHT:
-                direction += value
-                direction %= 360
-            elif action == FORWARD:
-                if direction == 0:
-                    pos_x += value
-                elif direction == 90:
-                    pos_y -= value
-                elif direction == 180:
-                    pos_x -= value
-                elif direction == 270:
-                    pos_y += value
-
-        print(abs(pos_x) + abs(pos_y))
+            elif direction == 270:
+                pos_y += value
+
+    return abs(pos_x) + abs(pos_y)
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -169,53 +171,60 @@ def puzzle_2() -> None:
     The answer should be 47806.
     """
 
-    with open("day_12/input.txt", 'r') as f:
-        instructions = [line.strip() for line in f.readlines()]
-        ship_pos_x = 0
-        ship_pos_y = 0
-        waypoint_pos_x = 10
-        waypoint_pos_y = 1
-
-        for instruction in instructions:
-            action = instruction[0]
-            value = int(instruction[1:])
-
-            if action == NORTH:
-                waypoint_pos_y += value
-            elif action == SOUTH:
-                waypoint_pos_y -= value
-            elif action == EAST:
-                waypoint_pos_x += value
-            elif action == WEST:
-                waypoint_pos_x -= value
-            elif action == LEFT:
-                if value == 90:
-                    new_pos_x = -waypoint_pos_y
-                    waypoint_pos_y = waypoint_pos_x
-                    waypoint_pos_x = new_pos_x
-                elif value == 180:
-                    waypoint_pos_x = -waypoint_pos_x
-                    waypoint_pos_y = -waypoint_pos_y
-                elif value == 270:
-                    new_pos_x = waypoint_pos_y
-                    waypoint_pos_y = -waypoint_pos_x
-                    waypoint_pos_x = new_pos_x
-            elif action == RIGHT:
-                if value == 90:
-                    new_pos_x = waypoint_pos_y
-                    waypoint_pos_y = -waypoint_pos_x
-                    waypoint_pos_x = new_pos_x
-                elif value == 180:
-                    waypoint_pos_x = -waypoint_pos_x
-                    waypoint_pos_y = -waypoint_pos_y
-                elif value == 270:
-                    new_pos_x = -waypoint_pos_y
-                    waypoint_pos_y = waypoint_pos_x
-                    waypoint_pos_x = new_pos_x
-            elif action == FORWARD:
-                ship_pos_x += value * waypoint_pos_x
-                ship_pos_y += value * waypoint_pos_y
-
-        print(abs(ship_pos_x) + abs(ship_pos_y))
+    instructions = load_input(file_path, _get_instructions)
+    ship_pos_x = 0
+    ship_pos_y = 0
+    waypoint_pos_x = 10
+    waypoint_pos_y = 1
+
+    for action, value in instructions:
+        if action == NORTH:
+            waypoint_pos_y += value
+        elif action == SOUTH:
+            waypoint_pos_y -= value
+        elif action == EAST:
+            waypoint_pos_x += value
+        elif action == WEST:
+            waypoint_pos_x -= value
+        elif action == LEFT:
+            if value == 90:
+                new_pos_x = -waypoint_pos_y
+                waypoint_pos_y = waypoint_pos_x
+                waypoint_pos_x = new_pos_x
+            elif value == 180:
+                waypoint_pos_x = -waypoint_pos_x
+                waypoint_pos_y = -waypoint_pos_y
+            elif value == 270:
+                new_pos_x = waypoint_pos_y
+                waypoint_pos_y = -waypoint_pos_x
+                waypoint_pos_x = new_pos_x
+        elif action == RIGHT:
+            if value == 90:
+                new_pos_x = waypoint_pos_y
+                waypoint_pos_y = -waypoint_pos_x
+                waypoint_pos_x = new_pos_x
+            elif value == 180:
+                waypoint_pos_x = -waypoint_pos_x
+                waypoint_pos_y = -waypoint_pos_y
+            elif value == 270:
+                new_pos_x = -waypoint_pos_y
+                waypoint_pos_y = waypoint_pos_x
+                waypoint_pos_x = new_pos_x
+        elif action == FORWARD:
+            ship_pos_x += value * waypoint_pos_x
+            ship_pos_y += value * waypoint_pos_y
+
+    return abs(ship_pos_x) + abs(ship_pos_y)
+
+################################################################################
+
+def _get_instructions(file_path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    :param file_path: file path with the navigation instructions
+    :return: (action, value) instructions
+    """
+
+    return tuple((line[:1].decode(), int(line[1:]))
+                 for line in iter_lines(file_path))
 
 ################################################################################
@@ -0,0 +1,49 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator
+
+from day_12.day_12 import NORTH, SOUTH, EAST, WEST, LEFT, RIGHT, FORWARD
+
+"""
+Generator of navigation instructions of any size.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 790
+VALUE_MAX = 100
+ANGLES = (90, 180, 270)
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the instructions to
+    :param size: number of instructions
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_instructions(size, Random(seed)))
+
+################################################################################
+
+def _generate_instructions(size: int, random: Random) -> Iterator[str]:
+    """
+    :param size: number of instructions
+    :param random: random numbers generator
+    :return: navigation instructions lines
+    """
+
+    for _ in range(size):
+        action = random.choice(
+            (NORTH, SOUTH, EAST, WEST, LEFT, RIGHT, FORWARD, FORWARD))
+        if action == LEFT or action == RIGHT:
+            value = random.choice(ANGLES)
+        else:
+            value = random.randint(1, VALUE_MAX)
+        yield "{}{}\n".format(action, value)
+
+################################################################################
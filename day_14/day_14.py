@@ -1,9 +1,13 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from typing import Tuple
+from typing import Tuple, Union
 from itertools import product
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
+
 """
 --- Day 14: Docking Data ---
 
@@ -15,6 +19,7 @@ initialized in the docking program's memory.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_14/input.txt"
 BITMASK_LENGTH = 36
 BITMASK_INSTRUCTION = "mask"
 BITMASK_FLOATING = 'X'
@@ -25,7 +30,8 @@ ADDRESS_DELIMITER_RIGHT = ']'
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -93,25 +99,22 @@ def puzzle_1() -> None:
     The answer should be 14553106347726.
     """
 
-    with open("day_14/input.txt", 'r') as f:
-        program = [line.strip() for line in f.readlines()]
-        bitmask = None
-        memory = {}
+    bitmask = None
+    memory = {}
 
-        for line in program:
-            if line.startswith(BITMASK_INSTRUCTION):
-                bitmask = line.split(INSTRUCTION_DELIMITER)[1].strip()
-            elif line.startswith(WRITE_INSTRUCTION):
-                address = line.split(ADDRESS_DELIMITER_LEFT)[1] \
-                    .split(ADDRESS_DELIMITER_RIGHT)[0].strip()
-                value = int(line.split(INSTRUCTION_DELIMITER)[1].strip())
-                memory[address] = _decode(value, bitmask)
+    for instruction in load_input(file_path, _get_program):
+        if instruction[0] == BITMASK_INSTRUCTION:
+            bitmask = instruction[1]
+        elif instruction[0] == WRITE_INSTRUCTION:
+            address, value = instruction[1:]
+            memory[address] = _decode(value, bitmask)
 
-        print(sum([memory[key] for key in memory]))
+    return sum([memory[key] for key in memory])
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -187,22 +190,44 @@ def puzzle_2() -> None:
     The answer should be 2737766154126.
     """
 
-    with open("day_14/input.txt", 'r') as f:
-        program = [line.strip() for line in f.readlines()]
-        bitmask = None
-        memory = {}
-
-        for line in program:
-            if line.startswith(BITMASK_INSTRUCTION):
-                bitmask = line.split(INSTRUCTION_DELIMITER)[1].strip()
-            elif line.startswith(WRITE_INSTRUCTION):
-                address = int(line.split(ADDRESS_DELIMITER_LEFT)[1] \
-                              .split(ADDRESS_DELIMITER_RIGHT)[0].strip())
-                value = int(line.split(INSTRUCTION_DELIMITER)[1].strip())
-                [memory.__setitem__(address, value)
-                 for address in _decode_2(address, bitmask)]
-
-        print(sum([memory[key] for key in memory]))
+    bitmask = None
+    memory = {}
+
+    for instruction in load_input(file_path, _get_program):
+        if instruction[0] == BITMASK_INSTRUCTION:
+            bitmask = instruction[1]
+        elif instruction[0] == WRITE_INSTRUCTION:
+            address, value = instruction[1:]
+            [memory.__setitem__(address, value)
+             for address in _decode_2(address, bitmask)]
+
+    return sum([memory[key] for key in memory])
+
+################################################################################
+
+def _get_program(file_path: str) \
+        -> Tuple[Tuple[Union[str, int], ...], ...]:
+    """
+    :param file_path: file path with the initialization program
+    :return: instructions; (BITMASK_INSTRUCTION, bitmask) or
+    (WRITE_INSTRUCTION, address, value)
+    """
+
+    program = []
+
+    for line in (line.decode().strip() for line in iter_lines(file_path)):
+        if line.startswith(BITMASK_INSTRUCTION):
+            program.append((
+                BITMASK_INSTRUCTION,
+                line.split(INSTRUCTION_DELIMITER)[1].strip()))
+        elif line.startswith(WRITE_INSTRUCTION):
+            program.append((
+                WRITE_INSTRUCTION,
+                int(line.split(ADDRESS_DELIMITER_LEFT)[1]
+                    .split(ADDRESS_DELIMITER_RIGHT)[0].strip()),
+                int(line.split(INSTRUCTION_DELIMITER)[1].strip())))
+
+    return tuple(program)
 
 ################################################################################
 
@@ -0,0 +1,63 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+from typing import Iterator
+
+from day_14.day_14 import \
+    BITMASK_LENGTH, BITMASK_INSTRUCTION, BITMASK_FLOATING, WRITE_INSTRUCTION
+
+"""
+Generator of initialization programs of any size.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 539
+FLOATING_BITS_MAX = 9
+WRITES_MAX = 6
+ADDRESS_MAX = 65535
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0,
+             floating_bits_max: int = FLOATING_BITS_MAX) -> None:
+    """
+    :param file_path: file path to write the program to
+    :param size: number of lines
+    :param seed: random seed
+    :param floating_bits_max: maximum count of floating bits in a bitmask;
+    every memory write of the second puzzle writes to 2 ** count addresses
+    """
+
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_lines(size, floating_bits_max, Random(seed)))
+
+################################################################################
+
+def _generate_lines(size: int, floating_bits_max: int,
+                    random: Random) -> Iterator[str]:
+    """
+    :param size: number of lines
+    :param floating_bits_max: maximum count of floating bits in a bitmask
+    :param random: random numbers generator
+    :return: program lines
+    """
+
+    writes = 0
+    for i in range(size):
+        if writes == 0:
+            bitmask = [random.choice("01") for _ in range(BITMASK_LENGTH)]
+            for position in random.sample(
+                    range(BITMASK_LENGTH),
+                    random.randint(0, floating_bits_max)):
+                bitmask[position] = BITMASK_FLOATING
+            writes = random.randint(1, WRITES_MAX)
+            yield "{} = {}\n".format(BITMASK_INSTRUCTION, ''.join(bitmask))
+        else:
+            writes -= 1
+            yield "{}[{}] = {}\n".format(
+                WRITE_INSTRUCTION, random.randint(0, ADDRESS_MAX),
+                random.randrange(2 ** BITMASK_LENGTH))
+
+################################################################################
@@ -1,7 +1,10 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from common.input_loader import load_input
+from common.instrumentation import timed
 
 """
 --- Day 15: Rambunctious Recitation ---
@@ -17,13 +20,15 @@ the rules!
 
 ################################################################################
 
-INPUT = [6, 19, 0, 5, 7, 13, 1]
+INPUT_FILE_PATH = "day_15/input.txt"
+NUMBERS_DELIMITER = ','
 GOAL_NUMBER_1 = 2020
 GOAL_NUMBER_2 = 30000000
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -80,11 +85,13 @@ def puzzle_1() -> None:
     The answer should be 468.
     """
 
-    print(_play_the_game(GOAL_NUMBER_1))
+    return _play_the_game(
+        load_input(file_path, _get_starting_numbers), GOAL_NUMBER_1)
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -104,14 +111,30 @@ def puzzle_2() -> None:
     The answer should be 1801753.
     """
 
-    print(_play_the_game(GOAL_NUMBER_2))
+    return _play_the_game(
+        load_input(file_path, _get_starting_numbers), GOAL_NUMBER_2)
+
+################################################################################
+
+def _get_starting_numbers(file_path: str) -> Tuple[int, ...]:
+    """
+    :param file_path: file path with comma separated starting numbers
+    :return: list of starting numbers
+    """
+
+    with open(file_path, 'r') as f:
+        return tuple(int(number.strip())
+                     for number in f.read().split(NUMBERS_DELIMITER))
 
 ################################################################################
 
-def _play_the_game(goal_number: int) -> int:
+@timed()
+def _play_the_game(starting_numbers: Tuple[int, ...],
+                   goal_number: int) -> int:
     """
     Play the game for the specified number of turns.
 
+    :param starting_numbers: numbers the players start with
     :param goal_number: number of turns
     :return: the last spoken number
     """
@@ -122,9 +145,9 @@ def _play_the_game(goal_number: int) -> int:
     most_recent = None
 
     for i in range(goal_number):
-        if i < len(INPUT):
+        if i < len(starting_numbers):
             # start by just reading the input numbers
-            new_number = INPUT[i]
+            new_number = starting_numbers[i]
         else:
             if len(indexes[most_recent]) == 1:
                 # the first time the number has been spoken
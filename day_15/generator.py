@@ -0,0 +1,31 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+
+from day_15.day_15 import NUMBERS_DELIMITER
+
+"""
+Generator of starting numbers of any count. The running time of the game
+depends on the number of turns, not on the count of the starting numbers.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 7
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the starting numbers to
+    :param size: count of the starting numbers
+    :param seed: random seed
+    """
+
+    with open(file_path, 'w') as f:
+        f.write(NUMBERS_DELIMITER.join(
+            str(number)
+            for number in Random(seed).sample(range(size * 3), size)) + '\n')
+
+################################################################################
@@ -4,6 +4,10 @@ __email__ = "tofugangsw@gmail.com"
 from typing import List
 from pyparsing import Word, nums, nestedExpr
 
+from common.input_loader import load_input
+from common.instrumentation import timed
+from common.mmap_reader import iter_lines
+
 """
 --- Day 18: Operation Order ---
 
@@ -17,6 +21,7 @@ remember.
 
 ################################################################################
 
+INPUT_FILE_PATH = "day_18/input.txt"
 ADDITION = '+'
 MULTIPLICATION = '*'
 OPEN_BRACKET = '('
@@ -24,7 +29,8 @@ CLOSE_BRACKET = ')'
 
 ################################################################################
 
-def puzzle_1() -> None:
+@timed()
+def puzzle_1(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part One ---
 
@@ -74,16 +80,13 @@ def puzzle_1() -> None:
     The answer should be 3647606140187.
     """
 
-    with open("day_18/input.txt", 'r') as f:
-        lines = ['(' + line.strip() + ')' for line in f.readlines()]
-        content = Word(nums) | '+' | '*'
-        parentheses = nestedExpr('(', ')', content=content)
-        print(sum([_evaluate_1(parentheses.parseString(line))
-                   for line in lines]))
+    return sum([_evaluate_1(expression)
+                for expression in load_input(file_path, _get_expressions)])
 
 ################################################################################
 
-def puzzle_2() -> None:
+@timed()
+def puzzle_2(file_path: str = INPUT_FILE_PATH) -> int:
     """
     --- Part Two ---
 
@@ -118,12 +121,22 @@ def puzzle_2() -> None:
     The answer should be 323802071857594.
     """
 
-    with open("day_18/input.txt", 'r') as f:
-        lines = ['(' + line.strip() + ')' for line in f.readlines()]
-        content = Word(nums) | '+' | '*'
-        parentheses = nestedExpr('(', ')', content=content)
-        print(sum([_evaluate_2(parentheses.parseString(line))
-                   for line in lines]))
+    return sum([_evaluate_2(expression)
+                for expression in load_input(file_path, _get_expressions)])
+
+################################################################################
+
+def _get_expressions(file_path: str) -> List:
+    """
+    :param file_path: file path with the homework
+    :return: parsed expressions, nested lists of numbers, operators and
+    subexpressions
+    """
+
+    content = Word(nums) | '+' | '*'
+    parentheses = nestedExpr('(', ')', content=content)
+    return [parentheses.parseString('(' + line.decode().strip() + ')')
+            for line in iter_lines(file_path)]
 
 ################################################################################
 
@@ -0,0 +1,60 @@
+__author__ = "Tofu Gang"
+__email__ = "tofugangsw@gmail.com"
+
+from random import Random
+
+from day_18.day_18 import \
+    ADDITION, MULTIPLICATION, OPEN_BRACKET, CLOSE_BRACKET
+
+"""
+Generator of math homework of any size.
+"""
+
+################################################################################
+
+BUNDLED_SIZE = 376
+OPERANDS_MIN = 2
+OPERANDS_MAX = 6
+DEPTH_MAX = 3
+SUBEXPRESSION_PROBABILITY = 0.25
+
+################################################################################
+
+def generate(file_path: str, size: int, seed: int = 0) -> None:
+    """
+    :param file_path: file path to write the expressions to
+    :param size: number of expressions
+    :param seed: random seed
+    """
+
+    random = Random(seed)
+    with open(file_path, 'w') as f:
+        f.writelines(_generate_expression(0, random) + '\n'
+                     for _ in range(size))
+
+################################################################################
+
+def _generate_expression(depth: int, random: Random) -> str:
+    """
+    :param depth: how deep in brackets the expression is
+    :param random: random numbers generator
+    :return: expression
+    """
+
+    operands = []
+    for _ in range(random.randint(OPERANDS_MIN, OPERANDS_MAX)):
+        if depth < DEPTH_MAX and random.random() < SUBEXPRESSION_PROBABILITY:
+            operands.append(OPEN_BRACKET
+                            + _generate_expression(depth + 1, random)
+                            + CLOSE_BRACKET)
+        else:
+            operands.append(str(random.randint(1, 9)))
+
+    expression = operands[0]
+    for operand in operands[1:]:
+        expression += " {} {}".format(
+            random.choice((ADDITION, MULTIPLICATION)), operand)
+
+    return expression
+
+################################################################################
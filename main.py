@@ -1,12 +1,159 @@
 __author__ = "Tofu Gang"
 __email__ = "tofugangsw@gmail.com"
 
-from day_18.day_18 import puzzle_2 as puzzle
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List
+
+from common.input_loader import clear_cache
+from common.instrumentation import export_json
+from common.registry import DAYS, PARTS
+from common.runner import run_all, run_puzzle, KEY_DAY, KEY_PART, \
+    KEY_ANSWER, KEY_SECONDS, KEY_ERROR, KEY_CORRECT, KEY_PHASES, KEY_MEMORY
+
+################################################################################
+
+def parse_arguments(arguments: List[str] = None) -> Namespace:
+    """
+    :param arguments: command line arguments, sys.argv is used if None
+    :return: parsed command line arguments
+    """
+
+    parser = ArgumentParser(description="Advent of Code 2020 puzzles.")
+    parser.add_argument(
+        "--day", type=int, choices=sorted(DAYS),
+        help="day to run")
+    parser.add_argument(
+        "--part", type=int, choices=PARTS,
+        help="puzzle part to run; both parts are run if omitted")
+    parser.add_argument(
+        "--input", dest="file_path",
+        help="puzzle input file path; the bundled input.txt if omitted")
+    parser.add_argument(
+        "--repeat", type=int, default=1,
+        help="how many times to run each puzzle with --day; if more than "
+             "once, every run solves the puzzle from scratch (no cached "
+             "answer or parsed input) and the times of the runs are printed")
+    parser.add_argument(
+        "--no-cache", dest="use_cache", action="store_false",
+        help="always solve the puzzles, do not use the cached answers")
+    parser.add_argument(
+        "--all", dest="run_all", action="store_true",
+        help="run all the puzzles on their bundled inputs in a process pool")
+    parser.add_argument(
+        "--workers", type=int,
+        help="number of worker processes for --all; CPU count if omitted")
+    parser.add_argument(
+        "--phases", dest="phases_file_path",
+        help="record the parse and solve phases of the puzzles and write them "
+             "to this JSON file; implies --no-cache")
+    parser.add_argument(
+        "--memory", dest="memory_file_path",
+        help="profile the memory usage of the puzzles (peak traced memory, "
+             "top allocation sites, RSS over time) and write it to this JSON "
+             "file; implies --no-cache")
+    parser.add_argument(
+        "--no-trace", dest="trace", action="store_false",
+        help="with --memory, only sample the RSS and do not trace the "
+             "allocations (tracing needs a lot of extra memory); puzzles "
+             "known not to fit when traced are never traced on the bundled "
+             "input")
+
+    parsed = parser.parse_args(arguments)
+    if parsed.run_all == (parsed.day is not None):
+        parser.error("exactly one of --day and --all is required")
+    if parsed.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return parsed
+
+################################################################################
+
+def main(arguments: List[str] = None) -> None:
+    """
+    Runs the puzzles selected on the command line.
+
+    :param arguments: command line arguments, sys.argv is used if None
+    """
+
+    arguments = parse_arguments(arguments)
+    instrument = arguments.phases_file_path is not None
+    profile = arguments.memory_file_path is not None
+    # cached answers would skip the phases, the memory usage and the repeated
+    # runs
+    use_cache = arguments.use_cache and not instrument and not profile \
+        and arguments.repeat == 1
+
+    if arguments.run_all:
+        results = run_all(workers=arguments.workers, use_cache=use_cache,
+                          instrument=instrument, profile=profile,
+                          trace=arguments.trace)
+        for result in results:
+            print(_format_result(result))
+    else:
+        results = []
+        parts = PARTS if arguments.part is None else (arguments.part,)
+        for part in parts:
+            seconds = []
+            for _ in range(arguments.repeat):
+                if arguments.repeat > 1:
+                    # parse the input again in every run
+                    clear_cache()
+                result = run_puzzle(arguments.day, part, arguments.file_path,
+                                    use_cache, instrument, profile,
+                                    arguments.trace)
+                if result[KEY_ERROR] is not None:
+                    raise SystemExit(result[KEY_ERROR])
+                seconds.append(result[KEY_SECONDS])
+            print(result[KEY_ANSWER])
+            if arguments.repeat > 1:
+                print(_format_repeats(seconds))
+            results.append(result)
+
+    if instrument:
+        export_json(arguments.phases_file_path, [
+            {key: result[key] for key in (KEY_DAY, KEY_PART, KEY_PHASES)}
+            for result in results])
+    if profile:
+        export_json(arguments.memory_file_path, [
+            {key: result[key] for key in (KEY_DAY, KEY_PART, KEY_MEMORY)}
+            for result in results])
+
+    wrong = ["day {} part {}".format(result[KEY_DAY], result[KEY_PART])
+             for result in results if result[KEY_CORRECT] is False]
+    if wrong:
+        raise SystemExit("Wrong answers: {}.".format(', '.join(wrong)))
+
+################################################################################
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """
+    :param result: puzzle result
+    :return: result line with the day, the part, the answer, the time and if
+    the answer is correct
+    """
+
+    return "day {:>2} part {}: {:>20} {:>10} s {}".format(
+        result[KEY_DAY], result[KEY_PART],
+        result[KEY_ANSWER] if result[KEY_ERROR] is None else result[KEY_ERROR],
+        '' if result[KEY_SECONDS] is None
+        else "{:.3f}".format(result[KEY_SECONDS]),
+        {True: "ok", False: "WRONG", None: ''}[result[KEY_CORRECT]])
+
+################################################################################
+
+def _format_repeats(seconds: List[float]) -> str:
+    """
+    :param seconds: running times of the repeated runs of a puzzle
+    :return: line with the running times and the fastest one
+    """
+
+    return "{} s (min {:.3f} s)".format(
+        ' '.join("{:.3f}".format(run_seconds) for run_seconds in seconds),
+        min(seconds))
 
 ################################################################################
 
 if __name__ == "__main__":
-    puzzle()
+    main()
     exit(0)
 
-################################################################################
\ No newline at end of file
+################################################################################